@@ -0,0 +1,75 @@
+from typing import Dict, Optional, Tuple
+import base64
+import hashlib
+import json
+import re
+import time
+
+_JWT_FORMAT = re.compile(r'[A-Za-z0-9_\-]+\.[A-Za-z0-9_\-]+\.[A-Za-z0-9_\-]+')
+
+def looks_like_jwt(token: str) -> bool:
+    """Cheap structural check used to reject garbage before any validation."""
+    return 20 <= len(token) <= 4096 and _JWT_FORMAT.fullmatch(token) is not None
+
+
+class ValidTokenCache:
+    """TTL cache of bearer-token validation decisions.
+
+    Tokens are stored as blake2b digests, never in raw form.
+    """
+
+    def __init__(self, ttl: float = 120.0, maxsize: int = 10_000, negative_ttl: float = 10.0):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.maxsize = maxsize
+        self._entries: Dict[bytes, Tuple[bool, float]] = {}
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    @staticmethod
+    def _token_expiry(token: str) -> Optional[float]:
+        # Read the unverified `exp` claim so a cached decision never outlives the JWT
+        try:
+            payload = token.split('.')[1]
+            payload += '=' * (-len(payload) % 4)
+            exp = json.loads(base64.urlsafe_b64decode(payload)).get('exp')
+            return float(exp) if exp is not None else None
+        except Exception:
+            return None
+
+    def get(self, token: str) -> Optional[bool]:
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        decision, expires_at = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        return decision
+
+    def set(self, token: str, decision: bool) -> None:
+        # Rejections are kept briefly, enough to absorb bursts of the same bad token
+        ttl = self.ttl if decision else self.negative_ttl
+        exp = self._token_expiry(token)
+        if exp is not None:
+            ttl = min(ttl, exp - time.time())
+        if ttl <= 0:
+            return
+
+        if len(self._entries) >= self.maxsize:
+            self._evict()
+        self._entries[self._key(token)] = (decision, time.monotonic() + ttl)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        for key in [k for k, (_, expires_at) in self._entries.items() if expires_at <= now]:
+            del self._entries[key]
+        # Still full: drop the oldest insertion
+        while len(self._entries) >= self.maxsize:
+            del self._entries[next(iter(self._entries))]
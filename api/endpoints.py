@@ -1,10 +1,38 @@
 from typing import Dict, Any, Optional
+from datetime import datetime
+from decimal import Decimal
 import logging
+import orjson
+from uuid import uuid4
 from fastapi import FastAPI, HTTPException, Depends, BackgroundTasks
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from app.api.auth.token_cache import ValidTokenCache, looks_like_jwt
+from app.constants.settings import settings
+from app.core.services.http_pool import close_http_session, get_async_web3, get_pool_stats
+from app.core.services.receipt_watcher import ReceiptWatcher
+from app.database.async_pool import init_pools, close_pools, get_redis
 
-app = FastAPI(title="MEV Bot API", version="1.0.0")
+# Execution status lives in Redis so a poll can land on any worker process
+_EXECUTION_KEY = "strategy:execution:{}"
+_EXECUTION_TTL = 24 * 3600
+
+def _orjson_default(obj: Any) -> Any:
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+class DecimalORJSONResponse(ORJSONResponse):
+    """orjson-backed response that also encodes Decimal values as strings."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_orjson_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+app = FastAPI(title="MEV Bot API", version="1.0.0", default_response_class=DecimalORJSONResponse)
 security = HTTPBearer()
 logger = logging.getLogger(__name__)
 
@@ -13,6 +41,8 @@ class APIEndpoints:
         self.strategy_executor = strategy_executor
         self.monitoring = monitoring_system
         self.config = config_manager
+        self.token_cache = ValidTokenCache()
+        self.admin_token_cache = ValidTokenCache()
         self.setup_routes()
 
     def setup_routes(self):
@@ -21,25 +51,38 @@ class APIEndpoints:
             strategy_name: str,
             strategy_params: Dict[str, Any],
             background_tasks: BackgroundTasks,
-            credentials: HTTPAuthorizationCredentials = Depends(security)
+            credentials: HTTPAuthorizationCredentials = Depends(security),
+            redis=Depends(get_redis)
         ):
             try:
                 # Validate authentication
-                if not await self._validate_auth(credentials.credentials):
+                if not self._validate_auth(credentials.credentials):
                     raise HTTPException(status_code=401, detail="Invalid authentication")
 
-                # Execute strategy
-                execution_id = await self.strategy_executor.execute_strategy(
-                    strategy_name,
+                # Run the strategy after responding; progress is polled via /strategy/status
+                execution_id = uuid4().hex
+                record = {
+                    'execution_id': execution_id,
+                    'strategy_name': strategy_name,
+                    'status': 'running',
+                    'start_time': datetime.utcnow()
+                }
+                await self._save_execution(redis, record)
+                background_tasks.add_task(
+                    self._run_strategy,
+                    redis,
+                    record,
                     strategy_params
                 )
 
-                return JSONResponse({
-                    "status": "success",
+                return DecimalORJSONResponse({
+                    "status": "accepted",
                     "execution_id": execution_id,
                     "message": f"Strategy {strategy_name} execution initiated"
-                })
+                }, status_code=202)
 
+            except HTTPException:
+                raise
             except Exception as e:
                 logger.error(f"Strategy execution failed: {str(e)}")
                 raise HTTPException(status_code=500, detail=str(e))
@@ -47,13 +90,16 @@ class APIEndpoints:
         @app.get("/strategy/status/{execution_id}")
         async def get_execution_status(
             execution_id: str,
-            credentials: HTTPAuthorizationCredentials = Depends(security)
+            credentials: HTTPAuthorizationCredentials = Depends(security),
+            redis=Depends(get_redis)
         ):
             try:
-                status = await self.strategy_executor.get_execution_status(execution_id)
-                if not status:
+                status = await redis.get(_EXECUTION_KEY.format(execution_id))
+                if status is None:
                     raise HTTPException(status_code=404, detail="Execution not found")
-                return JSONResponse(status)
+                return DecimalORJSONResponse(orjson.loads(status))
+            except HTTPException:
+                raise
             except Exception as e:
                 logger.error(f"Failed to get execution status: {str(e)}")
                 raise HTTPException(status_code=500, detail=str(e))
@@ -64,7 +110,8 @@ class APIEndpoints:
         ):
             try:
                 metrics = await self.monitoring.get_system_metrics()
-                return JSONResponse(metrics)
+                metrics['http_pool'] = get_pool_stats()
+                return DecimalORJSONResponse(metrics)
             except Exception as e:
                 logger.error(f"Failed to get metrics: {str(e)}")
                 raise HTTPException(status_code=500, detail=str(e))
@@ -75,14 +122,14 @@ class APIEndpoints:
             credentials: HTTPAuthorizationCredentials = Depends(security)
         ):
             try:
-                if not await self._validate_admin_auth(credentials.credentials):
+                if not self._validate_admin_auth(credentials.credentials):
                     raise HTTPException(status_code=403, detail="Admin access required")
                 
                 success = await self.config.update_config(config_updates)
                 if not success:
                     raise HTTPException(status_code=400, detail="Failed to update config")
                 
-                return JSONResponse({
+                return DecimalORJSONResponse({
                     "status": "success",
                     "message": "Configuration updated successfully"
                 })
@@ -94,7 +141,7 @@ class APIEndpoints:
         async def health_check():
             try:
                 health_status = await self.monitoring.get_health_status()
-                return JSONResponse(health_status)
+                return DecimalORJSONResponse(health_status)
             except Exception as e:
                 logger.error(f"Health check failed: {str(e)}")
                 raise HTTPException(status_code=500, detail=str(e))
@@ -105,7 +152,7 @@ class APIEndpoints:
         ):
             try:
                 executions = await self.strategy_executor.get_active_executions()
-                return JSONResponse({
+                return DecimalORJSONResponse({
                     "active_executions": executions,
                     "count": len(executions)
                 })
@@ -113,11 +160,58 @@ class APIEndpoints:
                 logger.error(f"Failed to get active executions: {str(e)}")
                 raise HTTPException(status_code=500, detail=str(e))
 
-    async def _validate_auth(self, token: str) -> bool:
+    async def _run_strategy(self, redis, record: Dict[str, Any], params: Dict[str, Any]) -> None:
+        # Runs as a background task: the outcome is recorded, never raised
+        try:
+            result = await self.strategy_executor.execute_strategy(
+                record['strategy_name'],
+                params,
+                execution_id=record['execution_id']
+            )
+            record.update(status='completed', result=result)
+        except Exception as e:
+            logger.error(f"Strategy execution {record['execution_id']} failed: {str(e)}")
+            record.update(status='failed', error=str(e))
+        record['end_time'] = datetime.utcnow()
+        try:
+            await self._save_execution(redis, record)
+        except Exception as e:
+            logger.error(f"Failed to record execution status: {str(e)}")
+
+    @staticmethod
+    async def _save_execution(redis, record: Dict[str, Any]) -> None:
+        await redis.set(
+            _EXECUTION_KEY.format(record['execution_id']),
+            # Strategy results may carry Decimal or HexBytes; keep them as strings
+            orjson.dumps(record, default=str),
+            ex=_EXECUTION_TTL
+        )
+
+    def _validate_auth(self, token: str) -> bool:
+        if not looks_like_jwt(token):
+            return False
+        cached = self.token_cache.get(token)
+        if cached is not None:
+            return cached
+        decision = self._verify_token(token)
+        self.token_cache.set(token, decision)
+        return decision
+
+    def _validate_admin_auth(self, token: str) -> bool:
+        if not looks_like_jwt(token):
+            return False
+        cached = self.admin_token_cache.get(token)
+        if cached is not None:
+            return cached
+        decision = self._verify_admin_token(token)
+        self.admin_token_cache.set(token, decision)
+        return decision
+
+    def _verify_token(self, token: str) -> bool:
         # Implement your authentication logic here
         return True
 
-    async def _validate_admin_auth(self, token: str) -> bool:
+    def _verify_admin_token(self, token: str) -> bool:
         # Implement your admin authentication logic here
         return True
 
@@ -128,5 +222,21 @@ def create_app(
     config_manager
 ) -> FastAPI:
     APIEndpoints(strategy_executor, monitoring_system, config_manager)
+
+    # Startup runs once per worker process, so each worker gets its own
+    # Web3 client and receipt watcher to share across requests. No nonce
+    # manager is published here: NonceManager counts per process, and
+    # several workers signing for one account would reuse nonces
+    @app.on_event("startup")
+    async def startup_event():
+        await init_pools(app)
+        app.state.web3 = await get_async_web3(settings.WEB3_PROVIDER_URL)
+        app.state.receipt_watcher = ReceiptWatcher(app.state.web3)
+
+    @app.on_event("shutdown")
+    async def shutdown_event():
+        await close_pools(app)
+        await close_http_session()
+
     return app
 
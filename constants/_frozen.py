@@ -0,0 +1,7 @@
+from typing import Final
+from app.constants.settings import settings
+
+# Trading limits resolved once at import so hot paths skip settings attribute access
+MIN_ORDER_SIZE: Final[float] = float(settings.MIN_ORDER_SIZE)
+MAX_ORDER_SIZE: Final[float] = float(settings.MAX_ORDER_SIZE)
+MAX_LEVERAGE: Final[int] = int(settings.MAX_LEVERAGE)
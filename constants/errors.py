@@ -1,3 +1,5 @@
+from app.constants._frozen import MIN_ORDER_SIZE, MAX_ORDER_SIZE, MAX_LEVERAGE
+
 class ErrorCodes:
     # Authentication Errors
     AUTH_001 = "Invalid credentials"
@@ -23,12 +25,12 @@ class ErrorCodes:
 
 class ErrorMessages:
     INSUFFICIENT_BALANCE = "Insufficient balance to complete the transaction"
-    INVALID_ORDER_SIZE = f"Order size must be between {settings.MIN_ORDER_SIZE} and {settings.MAX_ORDER_SIZE}"
+    INVALID_ORDER_SIZE = f"Order size must be between {MIN_ORDER_SIZE} and {MAX_ORDER_SIZE}"
     PRICE_OUT_OF_RANGE = "Price is outside acceptable range"
     SLIPPAGE_EXCEEDED = "Slippage tolerance exceeded"
     ORDER_NOT_FOUND = "Order not found"
     POSITION_NOT_FOUND = "Position not found"
-    INVALID_LEVERAGE = f"Leverage must not exceed {settings.MAX_LEVERAGE}"
+    INVALID_LEVERAGE = f"Leverage must not exceed {MAX_LEVERAGE}"
     LIQUIDATION_RISK = "Position is at risk of liquidation"
     INTERNAL_ERROR = "An internal error occurred"
 
@@ -1,3 +1,5 @@
+from app.constants._frozen import MIN_ORDER_SIZE, MAX_ORDER_SIZE, MAX_LEVERAGE
+
 class SuccessMessages:
     # Trading
     ORDER_CREATED = "Order created successfully"
@@ -26,7 +28,7 @@ class InfoMessages:
 class ValidationMessages:
     INVALID_AMOUNT = "Invalid amount. Amount must be greater than {min_amount}"
     INVALID_PRICE = "Invalid price. Price must be between {min_price} and {max_price}"
-    MIN_ORDER_SIZE = f"Order size must be greater than {settings.MIN_ORDER_SIZE}"
-    MAX_ORDER_SIZE = f"Order size must be less than {settings.MAX_ORDER_SIZE}"
-    MAX_LEVERAGE = f"Leverage must be less than {settings.MAX_LEVERAGE}"
+    MIN_ORDER_SIZE = f"Order size must be greater than {MIN_ORDER_SIZE}"
+    MAX_ORDER_SIZE = f"Order size must be less than {MAX_ORDER_SIZE}"
+    MAX_LEVERAGE = f"Leverage must be less than {MAX_LEVERAGE}"
 
@@ -1,5 +1,5 @@
 from typing import Dict, Any
-from pydantic import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 import os
 
 class Settings(BaseSettings):
@@ -51,9 +51,7 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = "INFO"
     SENTRY_DSN: str = os.getenv("SENTRY_DSN", "")
 
-    class Config:
-        case_sensitive = True
-        env_file = ".env"
+    model_config = SettingsConfigDict(case_sensitive=True, env_file=".env", frozen=True)
 
 settings = Settings()
 
@@ -0,0 +1,61 @@
+from typing import Dict, List, Optional
+from functools import lru_cache
+from web3 import Web3
+from web3.contract import Contract
+from eth_account import Account
+from app.core.services.gas_optimization_service import GasOptimizationService
+from app.core.services.price_service import PriceService
+from app.core.services.nonce_manager import NonceManager
+from app.core.services.receipt_watcher import ReceiptWatcher
+from app.core.services.signing_pool import SigningPool
+
+WEI = 10 ** 18
+
+# Holds a reference to every ABI handed to a client so its id() stays a valid
+# cache key for the lifetime of the process
+_ABI_REGISTRY: Dict[int, List] = {}
+
+@lru_cache(maxsize=32)
+def _get_contract(web3: Web3, address: str, abi_id: int) -> Contract:
+    return web3.eth.contract(address=address, abi=_ABI_REGISTRY[abi_id])
+
+class ContractClientBase:
+    """Shared setup for the Order, Position and Trading contract clients.
+
+    Clients built for the same web3, address and ABI share one Contract.
+    """
+
+    def __init__(
+        self,
+        web3: Web3,
+        account: Account,
+        gas_service: GasOptimizationService,
+        price_service: PriceService,
+        contract_address: str,
+        contract_abi: List,
+        nonce_manager: Optional[NonceManager] = None,
+        receipt_watcher: Optional[ReceiptWatcher] = None,
+        signing_pool: Optional[SigningPool] = None
+    ):
+        self.web3 = web3
+        self.account = account
+        self.gas_service = gas_service
+        self.price_service = price_service
+        # Share one NonceManager between clients that sign with the same account
+        self.nonce_manager = nonce_manager or NonceManager(web3)
+        self.receipt_watcher = receipt_watcher or ReceiptWatcher(web3)
+        self.signing_pool = signing_pool
+
+        abi_id = id(contract_abi)
+        _ABI_REGISTRY.setdefault(abi_id, contract_abi)
+        self.contract = _get_contract(web3, Web3.to_checksum_address(contract_address), abi_id)
+        # Bind contract functions once rather than resolving them from the ABI per call
+        self._bind_contract(self.contract)
+
+    def _bind_contract(self, contract: Contract) -> None:
+        pass
+
+    async def _sign_transaction(self, tx: Dict) -> bytes:
+        if self.signing_pool is not None:
+            return await self.signing_pool.sign(tx)
+        return self.account.sign_transaction(tx).rawTransaction
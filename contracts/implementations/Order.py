@@ -1,34 +1,31 @@
-from typing import Dict, Optional, List
+from typing import ClassVar, Dict, Optional, List, Tuple
 from decimal import Decimal
+import asyncio
 import logging
-from web3 import Web3
-from eth_account import Account
+import time
+from web3.contract import Contract
 from datetime import datetime
 from contracts.interfaces.IOrder import IOrder
-from app.core.services.gas_optimization_service import GasOptimizationService
-from app.core.services.price_service import PriceService
+from contracts.implementations.ContractClient import ContractClientBase, WEI
+from app.core.services.web3_service import batch_contract_calls
 from app.core.exceptions import OrderError
+from app.core.types.custom_types import OrderSide, OrderType
 
 logger = logging.getLogger(__name__)
 
-class Order(IOrder):
-    def __init__(
-        self,
-        web3: Web3,
-        account: Account,
-        gas_service: GasOptimizationService,
-        price_service: PriceService,
-        contract_address: str,
-        contract_abi: List
-    ):
-        self.web3 = web3
-        self.account = account
-        self.gas_service = gas_service
-        self.price_service = price_service
-        self.contract = self.web3.eth.contract(
-            address=contract_address,
-            abi=contract_abi
-        )
+class Order(ContractClientBase, IOrder):
+    _TYPE_CODES: ClassVar[Dict[OrderType, int]] = {OrderType.MARKET: 0, OrderType.LIMIT: 1}
+    _STATUS_MAP: ClassVar[Dict[int, str]] = {
+        0: 'PENDING', 1: 'FILLED', 2: 'PARTIAL', 3: 'CANCELLED', 4: 'EXPIRED'
+    }
+
+    def _bind_contract(self, contract: Contract) -> None:
+        functions = contract.functions
+        self._fn_create_order = functions.createOrder
+        self._fn_cancel_order = functions.cancelOrder
+        self._fn_get_order_status = functions.getOrderStatus
+        self._fn_get_order_history = functions.getOrderHistory
+        self._ev_order_created = contract.events.OrderCreated()
 
     async def create_order(
         self,
@@ -41,32 +38,30 @@ class Order(IOrder):
     ) -> Dict:
         """Create a new order with the specified parameters."""
         try:
-            self._validate_order_inputs(side, order_type, price)
-            gas_params = await self.gas_service.get_optimal_gas_params()
-            current_price = await self.price_service.get_token_price(token_address)
-            
+            side, order_type = self._validate_order_inputs(side, order_type, price)
+            gas_params, current_price, nonce = await asyncio.gather(
+                self.gas_service.get_optimal_gas_params(),
+                self.price_service.get_token_price(token_address),
+                self.nonce_manager.next(self.account.address)
+            )
+
             if not current_price:
                 raise OrderError("Failed to get current token price")
 
             tx_params = {
                 'from': self.account.address,
                 'gasPrice': gas_params['gas_price'],
-                'nonce': await self.web3.eth.get_transaction_count(self.account.address)
+                'nonce': nonce
             }
 
-            order_params = {
-                'token_address': token_address,
-                'amount': int(amount * Decimal('1e18')),
-                'is_buy': side.upper() == 'BUY',
-                'price': int(price * Decimal('1e18')) if price else 0,
-                'expiration': expiration or int(datetime.now().timestamp() + 3600),
-                'order_type': self._get_order_type_code(order_type)
-            }
+            order_params = self._build_order_params(
+                token_address, amount, side, order_type, price, expiration
+            )
 
-            tx = await self.contract.functions.createOrder(**order_params).build_transaction(tx_params)
-            signed_tx = self.account.sign_transaction(tx)
-            tx_hash = await self.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
-            receipt = await self.web3.eth.wait_for_transaction_receipt(tx_hash)
+            tx = await self._fn_create_order(**order_params).build_transaction(tx_params)
+            raw_tx = await self._sign_transaction(tx)
+            tx_hash = await self.web3.eth.send_raw_transaction(raw_tx)
+            receipt = await self.receipt_watcher.wait_for_receipt(tx_hash)
 
             if receipt.status == 1:
                 order_id = self._get_order_id_from_receipt(receipt)
@@ -81,6 +76,7 @@ class Order(IOrder):
                 raise OrderError("Transaction failed")
 
         except Exception as e:
+            self.nonce_manager.reset(self.account.address)
             logger.error(f"Error creating order: {str(e)}")
             return {'success': False, 'error': str(e)}
 
@@ -91,17 +87,20 @@ class Order(IOrder):
             if order_status not in ['PENDING', 'PARTIAL']:
                 raise OrderError(f"Order cannot be cancelled. Status: {order_status}")
 
-            gas_params = await self.gas_service.get_optimal_gas_params()
+            gas_params, nonce = await asyncio.gather(
+                self.gas_service.get_optimal_gas_params(),
+                self.nonce_manager.next(self.account.address)
+            )
             tx_params = {
                 'from': self.account.address,
                 'gasPrice': gas_params['gas_price'],
-                'nonce': await self.web3.eth.get_transaction_count(self.account.address)
+                'nonce': nonce
             }
 
-            tx = await self.contract.functions.cancelOrder(order_id).build_transaction(tx_params)
-            signed_tx = self.account.sign_transaction(tx)
-            tx_hash = await self.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
-            receipt = await self.web3.eth.wait_for_transaction_receipt(tx_hash)
+            tx = await self._fn_cancel_order(order_id).build_transaction(tx_params)
+            raw_tx = await self._sign_transaction(tx)
+            tx_hash = await self.web3.eth.send_raw_transaction(raw_tx)
+            receipt = await self.receipt_watcher.wait_for_receipt(tx_hash)
 
             return {
                 'success': receipt.status == 1,
@@ -112,18 +111,34 @@ class Order(IOrder):
             }
 
         except Exception as e:
+            self.nonce_manager.reset(self.account.address)
             logger.error(f"Error cancelling order: {str(e)}")
             return {'success': False, 'error': str(e)}
 
     async def get_order_status(self, order_id: int) -> str:
         """Get the current status of an order."""
         try:
-            status_code = await self.contract.functions.getOrderStatus(order_id).call()
+            status_code = await self._fn_get_order_status(order_id).call()
             return self._parse_order_status(status_code)
         except Exception as e:
             logger.error(f"Error getting order status: {str(e)}")
             raise OrderError(f"Failed to get order status: {str(e)}")
 
+    async def get_order_statuses(self, order_ids: List[int]) -> Dict[int, str]:
+        """Get the current status of several orders in one batched request."""
+        try:
+            status_codes = await batch_contract_calls(
+                self.web3,
+                [self._fn_get_order_status(order_id) for order_id in order_ids]
+            )
+            return {
+                order_id: self._parse_order_status(code)
+                for order_id, code in zip(order_ids, status_codes)
+            }
+        except Exception as e:
+            logger.error(f"Error getting order statuses: {str(e)}")
+            raise OrderError(f"Failed to get order statuses: {str(e)}")
+
     async def get_order_history(
         self,
         start_time: Optional[int] = None,
@@ -132,56 +147,249 @@ class Order(IOrder):
     ) -> List[Dict]:
         """Get order history within the specified time range."""
         try:
-            end_time = end_time or int(datetime.now().timestamp())
+            end_time = end_time or int(time.time())
             start_time = start_time or (end_time - 30 * 24 * 3600)
 
-            raw_history = await self.contract.functions.getOrderHistory(
+            raw_history = await self._fn_get_order_history(
                 start_time,
                 end_time,
                 limit
             ).call()
 
-            return [self._parse_order_data(order) for order in raw_history]
+            return self._parse_order_history(raw_history)
 
         except Exception as e:
             logger.error(f"Error getting order history: {str(e)}")
             return []
 
-    def _validate_order_inputs(self, side: str, order_type: str, price: Optional[Decimal]):
-        if side.upper() not in ['BUY', 'SELL']:
+    def _validate_order_inputs(
+        self,
+        side: str,
+        order_type: str,
+        price: Optional[Decimal]
+    ) -> Tuple[OrderSide, OrderType]:
+        # Converted to enum members once here, so any case (or a member) is accepted
+        try:
+            side = OrderSide(side.upper())
+        except (AttributeError, ValueError):
             raise ValueError(f"Invalid order side: {side}")
-        if order_type.upper() not in ['MARKET', 'LIMIT']:
+        try:
+            order_type = OrderType(order_type.upper())
+        except (AttributeError, ValueError):
             raise ValueError(f"Invalid order type: {order_type}")
-        if order_type.upper() == 'LIMIT' and not price:
+        if order_type is OrderType.LIMIT and not price:
             raise ValueError("Price is required for limit orders")
+        return side, order_type
 
-    def _get_order_type_code(self, order_type: str) -> int:
-        order_types = {'MARKET': 0, 'LIMIT': 1}
-        return order_types.get(order_type.upper(), 0)
+    def _build_order_params(
+        self,
+        token_address: str,
+        amount: Decimal,
+        side: OrderSide,
+        order_type: OrderType,
+        price: Optional[Decimal],
+        expiration: Optional[int]
+    ) -> Dict:
+        return {
+            'token_address': token_address,
+            'amount': int(amount * WEI),
+            'is_buy': side is OrderSide.BUY,
+            'price': int(price * WEI) if price else 0,
+            'expiration': expiration or int(time.time() + 3600),
+            'order_type': self._get_order_type_code(order_type)
+        }
+
+    def _get_order_type_code(self, order_type: OrderType) -> int:
+        return self._TYPE_CODES.get(order_type, 0)
 
     def _parse_order_status(self, status_code: int) -> str:
-        status_map = {0: 'PENDING', 1: 'FILLED', 2: 'PARTIAL', 3: 'CANCELLED', 4: 'EXPIRED'}
-        return status_map.get(status_code, 'UNKNOWN')
+        return self._STATUS_MAP.get(status_code, 'UNKNOWN')
 
-    def _parse_order_data(self, raw_order: tuple) -> Dict:
-        return {
-            'order_id': raw_order[0],
-            'token_address': raw_order[1],
-            'amount': Decimal(str(raw_order[2])) / Decimal('1e18'),
-            'price': Decimal(str(raw_order[3])) / Decimal('1e18'),
-            'side': 'BUY' if raw_order[4] else 'SELL',
-            'order_type': 'MARKET' if raw_order[5] == 0 else 'LIMIT',
-            'status': self._parse_order_status(raw_order[6]),
-            'filled_amount': Decimal(str(raw_order[7])) / Decimal('1e18'),
-            'created_at': datetime.fromtimestamp(raw_order[8]),
-            'updated_at': datetime.fromtimestamp(raw_order[9])
-        }
+    def _parse_order_history(self, raw_history: List[tuple]) -> List[Dict]:
+        # Single pass with tuple unpacking and locally bound lookups; raw wei
+        # values exceed int64, so they stay Python ints until scaled here
+        status_map = self._STATUS_MAP
+        from_timestamp = datetime.fromtimestamp
+        return [
+            {
+                'order_id': order_id,
+                'token_address': token_address,
+                'amount': Decimal(amount).scaleb(-18),
+                'price': Decimal(price).scaleb(-18),
+                'side': 'BUY' if is_buy else 'SELL',
+                'order_type': 'MARKET' if type_code == 0 else 'LIMIT',
+                'status': status_map.get(status_code, 'UNKNOWN'),
+                'filled_amount': Decimal(filled_amount).scaleb(-18),
+                'created_at': from_timestamp(created_at),
+                'updated_at': from_timestamp(updated_at)
+            }
+            for (order_id, token_address, amount, price, is_buy, type_code,
+                 status_code, filled_amount, created_at, updated_at) in raw_history
+        ]
 
     def _get_order_id_from_receipt(self, receipt) -> int:
         try:
-            order_created_event = self.contract.events.OrderCreated().process_receipt(receipt)
+            order_created_event = self._ev_order_created.process_receipt(receipt)
             return order_created_event[0]['args']['orderId']
         except Exception as e:
             logger.error(f"Error extracting order ID from receipt: {str(e)}")
             raise OrderError("Failed to get order ID from transaction receipt")
 
+
+
+class BatchedOrderSubmitter:
+    """Coalesces orders submitted close together into one createOrders transaction.
+
+    Orders queued within `max_delay` seconds of the first one (up to
+    `max_batch_size`) are sent as a single bulk transaction and each caller
+    receives its own result. A lone order, or a contract without a
+    createOrders entrypoint, goes through Order.create_order unchanged.
+    """
+
+    def __init__(self, order: Order, max_batch_size: int = 16, max_delay: float = 0.02):
+        self.order = order
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._fn_create_orders = getattr(order.contract.functions, 'createOrders', None)
+        # Created on first submit so it binds to the running loop
+        self._queue: Optional[asyncio.Queue] = None
+        self._task = None
+
+    async def submit(
+        self,
+        token_address: str,
+        amount: Decimal,
+        side: str,
+        order_type: str,
+        price: Optional[Decimal] = None,
+        expiration: Optional[int] = None
+    ) -> Dict:
+        """Queue an order and wait for the result of the batch it lands in."""
+        request = {
+            'token_address': token_address,
+            'amount': amount,
+            'side': side,
+            'order_type': order_type,
+            'price': price,
+            'expiration': expiration
+        }
+        if self._fn_create_orders is None:
+            return await self.order.create_order(**request)
+
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((request, future))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return await future
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        batch = []
+        error = None
+        try:
+            while not self._queue.empty():
+                batch = [self._queue.get_nowait()]
+                deadline = loop.time() + self.max_delay
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+                await self._run_batch(batch)
+        except Exception as e:
+            logger.error(f"Order batch submitter stopped: {str(e)}")
+            error = e
+        finally:
+            # No caller may be left awaiting an order this task will never send
+            while not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+            for _, future in batch:
+                if future.done():
+                    continue
+                if error is None:
+                    future.cancel()
+                else:
+                    future.set_exception(error)
+
+    async def _run_batch(self, batch: List) -> None:
+        if len(batch) == 1:
+            request, future = batch[0]
+            result = await self.order.create_order(**request)
+            if not future.done():
+                future.set_result(result)
+            return
+
+        order = self.order
+        accepted = []
+        for request, future in batch:
+            try:
+                request['side'], request['order_type'] = order._validate_order_inputs(
+                    request['side'], request['order_type'], request['price']
+                )
+                accepted.append((request, future))
+            except Exception as e:
+                if not future.done():
+                    future.set_result({'success': False, 'error': str(e)})
+        if not accepted:
+            return
+
+        try:
+            tokens = list({request['token_address'] for request, _ in accepted})
+            gas_params, nonce, *prices = await asyncio.gather(
+                order.gas_service.get_optimal_gas_params(),
+                order.nonce_manager.next(order.account.address),
+                *(order.price_service.get_token_price(token) for token in tokens)
+            )
+            if not all(prices):
+                raise OrderError("Failed to get current token price")
+
+            tx_params = {
+                'from': order.account.address,
+                'gasPrice': gas_params['gas_price'],
+                'nonce': nonce
+            }
+            orders_params = [
+                order._build_order_params(
+                    request['token_address'],
+                    request['amount'],
+                    request['side'],
+                    request['order_type'],
+                    request['price'],
+                    request['expiration']
+                )
+                for request, _ in accepted
+            ]
+
+            tx = await self._fn_create_orders(orders_params).build_transaction(tx_params)
+            raw_tx = await order._sign_transaction(tx)
+            tx_hash = await order.web3.eth.send_raw_transaction(raw_tx)
+            receipt = await order.receipt_watcher.wait_for_receipt(tx_hash)
+            if receipt.status != 1:
+                raise OrderError("Transaction failed")
+
+            # OrderCreated is emitted once per order, in submission order
+            events = order._ev_order_created.process_receipt(receipt)
+            if len(events) != len(accepted):
+                raise OrderError("Batch receipt does not match submitted orders")
+
+            for (_, future), event in zip(accepted, events):
+                if not future.done():
+                    future.set_result({
+                        'success': True,
+                        'order_id': event['args']['orderId'],
+                        'transaction_hash': receipt.transactionHash.hex(),
+                        'gas_used': receipt.gasUsed,
+                        'effective_gas_price': receipt.effectiveGasPrice
+                    })
+
+        except Exception as e:
+            order.nonce_manager.reset(order.account.address)
+            logger.error(f"Error creating order batch: {str(e)}")
+            for _, future in accepted:
+                if not future.done():
+                    future.set_result({'success': False, 'error': str(e)})
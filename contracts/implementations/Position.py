@@ -1,33 +1,23 @@
-from typing import Dict, Optional, List
+from typing import Dict, Optional
 from decimal import Decimal
+import asyncio
 import logging
-from web3 import Web3
-from eth_account import Account
+from web3.contract import Contract
 from datetime import datetime
 from contracts.interfaces.IPosition import IPosition
-from app.core.services.gas_optimization_service import GasOptimizationService
-from app.core.services.price_service import PriceService
+from contracts.implementations.ContractClient import ContractClientBase, WEI
 
 logger = logging.getLogger(__name__)
 
-class Position(IPosition):
-    def __init__(
-        self,
-        web3: Web3,
-        account: Account,
-        gas_service: GasOptimizationService,
-        price_service: PriceService,
-        contract_address: str,
-        contract_abi: List
-    ):
-        self.web3 = web3
-        self.account = account
-        self.gas_service = gas_service
-        self.price_service = price_service
-        self.contract = self.web3.eth.contract(
-            address=contract_address,
-            abi=contract_abi
-        )
+class Position(ContractClientBase, IPosition):
+    def _bind_contract(self, contract: Contract) -> None:
+        functions = contract.functions
+        self._fn_open_position = functions.openPosition
+        self._fn_close_position_partial = functions.closePositionPartial
+        self._fn_close_position = functions.closePosition
+        self._fn_modify_position = functions.modifyPosition
+        self._fn_get_position = functions.getPosition
+        self._ev_position_opened = contract.events.PositionOpened()
 
     async def open_position(
         self,
@@ -39,8 +29,11 @@ class Position(IPosition):
         take_profit: Optional[Decimal] = None
     ) -> Dict:
         try:
-            gas_params = await self.gas_service.get_optimal_gas_params()
-            current_price = await self.price_service.get_token_price(token_address)
+            gas_params, current_price, nonce = await asyncio.gather(
+                self.gas_service.get_optimal_gas_params(),
+                self.price_service.get_token_price(token_address),
+                self.nonce_manager.next(self.account.address)
+            )
 
             if not current_price:
                 raise ValueError("Could not get current token price")
@@ -48,22 +41,22 @@ class Position(IPosition):
             tx_params = {
                 'from': self.account.address,
                 'gasPrice': gas_params['gas_price'],
-                'nonce': await self.web3.eth.get_transaction_count(self.account.address)
+                'nonce': nonce
             }
 
             position_params = {
                 'token_address': token_address,
-                'amount': int(amount * Decimal('1e18')),
+                'amount': int(amount * WEI),
                 'is_long': side.upper() == 'LONG',
-                'leverage': int(leverage * Decimal('1e18')) if leverage else int(Decimal('1e18')),
-                'stop_loss': int(stop_loss * Decimal('1e18')) if stop_loss else 0,
-                'take_profit': int(take_profit * Decimal('1e18')) if take_profit else 0
+                'leverage': int(leverage * WEI) if leverage else WEI,
+                'stop_loss': int(stop_loss * WEI) if stop_loss else 0,
+                'take_profit': int(take_profit * WEI) if take_profit else 0
             }
 
-            tx = await self.contract.functions.openPosition(**position_params).build_transaction(tx_params)
-            signed_tx = self.account.sign_transaction(tx)
-            tx_hash = await self.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
-            receipt = await self.web3.eth.wait_for_transaction_receipt(tx_hash)
+            tx = await self._fn_open_position(**position_params).build_transaction(tx_params)
+            raw_tx = await self._sign_transaction(tx)
+            tx_hash = await self.web3.eth.send_raw_transaction(raw_tx)
+            receipt = await self.receipt_watcher.wait_for_receipt(tx_hash)
 
             if receipt.status == 1:
                 position_id = self._get_position_id_from_receipt(receipt)
@@ -78,6 +71,7 @@ class Position(IPosition):
                 raise Exception("Transaction failed")
 
         except Exception as e:
+            self.nonce_manager.reset(self.account.address)
             logger.error(f"Error opening position: {str(e)}")
             return {'success': False, 'error': str(e)}
 
@@ -87,27 +81,30 @@ class Position(IPosition):
         amount: Optional[Decimal] = None
     ) -> Dict:
         try:
-            gas_params = await self.gas_service.get_optimal_gas_params()
+            gas_params, nonce = await asyncio.gather(
+                self.gas_service.get_optimal_gas_params(),
+                self.nonce_manager.next(self.account.address)
+            )
 
             tx_params = {
                 'from': self.account.address,
                 'gasPrice': gas_params['gas_price'],
-                'nonce': await self.web3.eth.get_transaction_count(self.account.address)
+                'nonce': nonce
             }
 
             if amount:
-                tx = await self.contract.functions.closePositionPartial(
+                tx = await self._fn_close_position_partial(
                     position_id,
-                    int(amount * Decimal('1e18'))
+                    int(amount * WEI)
                 ).build_transaction(tx_params)
             else:
-                tx = await self.contract.functions.closePosition(
+                tx = await self._fn_close_position(
                     position_id
                 ).build_transaction(tx_params)
 
-            signed_tx = self.account.sign_transaction(tx)
-            tx_hash = await self.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
-            receipt = await self.web3.eth.wait_for_transaction_receipt(tx_hash)
+            raw_tx = await self._sign_transaction(tx)
+            tx_hash = await self.web3.eth.send_raw_transaction(raw_tx)
+            receipt = await self.receipt_watcher.wait_for_receipt(tx_hash)
 
             return {
                 'success': receipt.status == 1,
@@ -117,6 +114,7 @@ class Position(IPosition):
             }
 
         except Exception as e:
+            self.nonce_manager.reset(self.account.address)
             logger.error(f"Error closing position: {str(e)}")
             return {'success': False, 'error': str(e)}
 
@@ -127,23 +125,26 @@ class Position(IPosition):
         take_profit: Optional[Decimal] = None
     ) -> Dict:
         try:
-            gas_params = await self.gas_service.get_optimal_gas_params()
+            gas_params, nonce = await asyncio.gather(
+                self.gas_service.get_optimal_gas_params(),
+                self.nonce_manager.next(self.account.address)
+            )
 
             tx_params = {
                 'from': self.account.address,
                 'gasPrice': gas_params['gas_price'],
-                'nonce': await self.web3.eth.get_transaction_count(self.account.address)
+                'nonce': nonce
             }
 
-            tx = await self.contract.functions.modifyPosition(
+            tx = await self._fn_modify_position(
                 position_id,
-                int(stop_loss * Decimal('1e18')) if stop_loss else 0,
-                int(take_profit * Decimal('1e18')) if take_profit else 0
+                int(stop_loss * WEI) if stop_loss else 0,
+                int(take_profit * WEI) if take_profit else 0
             ).build_transaction(tx_params)
 
-            signed_tx = self.account.sign_transaction(tx)
-            tx_hash = await self.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
-            receipt = await self.web3.eth.wait_for_transaction_receipt(tx_hash)
+            raw_tx = await self._sign_transaction(tx)
+            tx_hash = await self.web3.eth.send_raw_transaction(raw_tx)
+            receipt = await self.receipt_watcher.wait_for_receipt(tx_hash)
 
             return {
                 'success': receipt.status == 1,
@@ -153,19 +154,20 @@ class Position(IPosition):
             }
 
         except Exception as e:
+            self.nonce_manager.reset(self.account.address)
             logger.error(f"Error modifying position: {str(e)}")
             return {'success': False, 'error': str(e)}
 
     async def get_position_pnl(self, position_id: int) -> Dict:
         try:
-            position = await self.contract.functions.getPosition(position_id).call()
+            position = await self._fn_get_position(position_id).call()
             current_price = await self.price_service.get_token_price(position['token_address'])
 
             if not current_price:
                 raise ValueError("Could not get current token price")
 
-            entry_price = Decimal(str(position['entry_price'])) / Decimal('1e18')
-            amount = Decimal(str(position['amount'])) / Decimal('1e18')
+            entry_price = Decimal(position['entry_price']).scaleb(-18)
+            amount = Decimal(position['amount']).scaleb(-18)
             is_long = position['is_long']
 
             if is_long:
@@ -189,7 +191,7 @@ class Position(IPosition):
 
     def _get_position_id_from_receipt(self, receipt) -> int:
         try:
-            position_opened_event = self.contract.events.PositionOpened().process_receipt(receipt)
+            position_opened_event = self._ev_position_opened.process_receipt(receipt)
             return position_opened_event[0]['args']['positionId']
         except Exception as e:
             logger.error(f"Error extracting position ID from receipt: {str(e)}")
@@ -1,32 +1,18 @@
-from typing import Dict, Optional, List
+from typing import Dict, Optional
 from decimal import Decimal
+import asyncio
 import logging
-from web3 import Web3
-from eth_account import Account
+from web3.contract import Contract
 from contracts.interfaces.ITrading import ITrading
-from app.core.services.gas_optimization_service import GasOptimizationService
-from app.core.services.price_service import PriceService
+from contracts.implementations.ContractClient import ContractClientBase, WEI
 
 logger = logging.getLogger(__name__)
 
-class Trading(ITrading):
-    def __init__(
-        self,
-        web3: Web3,
-        account: Account,
-        gas_service: GasOptimizationService,
-        price_service: PriceService,
-        contract_address: str,
-        contract_abi: List
-    ):
-        self.web3 = web3
-        self.account = account
-        self.gas_service = gas_service
-        self.price_service = price_service
-        self.contract = self.web3.eth.contract(
-            address=contract_address,
-            abi=contract_abi
-        )
+class Trading(ContractClientBase, ITrading):
+    def _bind_contract(self, contract: Contract) -> None:
+        functions = contract.functions
+        self._fn_execute_market_order = functions.executeMarketOrder
+        self._fn_execute_limit_order = functions.executeLimitOrder
 
     async def get_token_price(self, token_address: str) -> Optional[Decimal]:
         try:
@@ -46,12 +32,15 @@ class Trading(ITrading):
         slippage: Optional[Decimal] = None
     ) -> Dict:
         try:
-            gas_params = await self.gas_service.get_optimal_gas_params()
-            
+            gas_params, nonce = await asyncio.gather(
+                self.gas_service.get_optimal_gas_params(),
+                self.nonce_manager.next(self.account.address)
+            )
+
             tx_params = {
                 'from': self.account.address,
                 'gasPrice': gas_params['gas_price'],
-                'nonce': await self.web3.eth.get_transaction_count(self.account.address)
+                'nonce': nonce
             }
 
             if order_type == 'MARKET':
@@ -63,9 +52,9 @@ class Trading(ITrading):
             else:
                 raise ValueError(f"Unsupported order type: {order_type}")
 
-            signed_tx = self.account.sign_transaction(tx)
-            tx_hash = await self.web3.eth.send_raw_transaction(signed_tx.rawTransaction)
-            receipt = await self.web3.eth.wait_for_transaction_receipt(tx_hash)
+            raw_tx = await self._sign_transaction(tx)
+            tx_hash = await self.web3.eth.send_raw_transaction(raw_tx)
+            receipt = await self.receipt_watcher.wait_for_receipt(tx_hash)
 
             return {
                 'success': receipt.status == 1,
@@ -75,6 +64,7 @@ class Trading(ITrading):
             }
 
         except Exception as e:
+            self.nonce_manager.reset(self.account.address)
             logger.error(f"Error executing trade: {str(e)}")
             return {'success': False, 'error': str(e)}
 
@@ -86,11 +76,11 @@ class Trading(ITrading):
         slippage: Optional[Decimal],
         tx_params: Dict
     ) -> Dict:
-        return await self.contract.functions.executeMarketOrder(
+        return await self._fn_execute_market_order(
             token_address,
-            int(amount * Decimal('1e18')),
+            int(amount * WEI),
             side == 'BUY',
-            int(slippage * Decimal('1e18')) if slippage else 0
+            int(slippage * WEI) if slippage else 0
         ).build_transaction(tx_params)
 
     async def _build_limit_order_tx(
@@ -101,10 +91,10 @@ class Trading(ITrading):
         price: Decimal,
         tx_params: Dict
     ) -> Dict:
-        return await self.contract.functions.executeLimitOrder(
+        return await self._fn_execute_limit_order(
             token_address,
-            int(amount * Decimal('1e18')),
+            int(amount * WEI),
             side == 'BUY',
-            int(price * Decimal('1e18'))
+            int(price * WEI)
         ).build_transaction(tx_params)
 
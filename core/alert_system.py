@@ -1,11 +1,21 @@
 from typing import Dict, Any, List, Optional
 import asyncio
+import itertools
 import logging
-from datetime import datetime, timedelta
+import operator
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 import smtplib
 from email.message import EmailMessage
 import aiohttp
+import orjson
+
+logger = logging.getLogger(__name__)
+
+_JSON_HEADERS = {'Content-Type': 'application/json'}
 
 class AlertPriority(Enum):
     LOW = "low"
@@ -13,17 +23,35 @@ class AlertPriority(Enum):
     HIGH = "high"
     CRITICAL = "critical"
 
+@dataclass(frozen=True)
+class AlertRecord:
+    # Explicit slots: alert_history keeps up to max_alert_history of these alive
+    __slots__ = ('ts_ns', 'title', 'message', 'priority', 'priority_str', 'data')
+    ts_ns: int
+    title: str
+    message: str
+    priority: AlertPriority
+    priority_str: str
+    data: Dict[str, Any]
+
 class AlertSystem:
+    # Email subject prefix per priority, built once
+    _PRIO_TAG = {p: f"[{p.value.upper()}] " for p in AlertPriority}
+
     def __init__(self, config: Dict[str, Any]):
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
+        # Bound once; these run on every failed send inside alert bursts
+        self.log_warning = logger.warning
+        self.log_exception = logger.exception
         self.config = config
         self._lock = asyncio.Lock()
         
         # Alert configuration
         self.email_config = config.get('email_alerts', {})
         self.webhook_urls = config.get('webhook_urls', {})
-        self.alert_history = []
         self.max_history_size = config.get('max_alert_history', 1000)
+        self.alert_history = deque(maxlen=self.max_history_size)
+        self._session: Optional[aiohttp.ClientSession] = None
         
         # Alert thresholds
         self.thresholds = config.get('alert_thresholds', {
@@ -32,19 +60,30 @@ class AlertSystem:
             'execution_time_threshold': 30  # seconds
         })
 
+        # (metric, threshold, comparison, title, message template, priority)
+        self._checks = (
+            ('gas_price', self.thresholds['gas_price_threshold'], operator.gt,
+             "High Gas Price Alert", "Current gas price: {} Gwei", AlertPriority.HIGH),
+            ('profit', self.thresholds['profit_threshold'], operator.lt,
+             "Low Profit Alert", "Current profit: {} ETH", AlertPriority.MEDIUM),
+            ('execution_time', self.thresholds['execution_time_threshold'], operator.gt,
+             "Slow Execution Alert", "Execution time: {}s", AlertPriority.MEDIUM),
+        )
+
     async def trigger_alert(self, 
                           title: str, 
                           message: str, 
                           priority: AlertPriority = AlertPriority.MEDIUM,
                           data: Optional[Dict[str, Any]] = None) -> bool:
         try:
-            alert = {
-                'timestamp': datetime.utcnow(),
-                'title': title,
-                'message': message,
-                'priority': priority,
-                'data': data or {}
-            }
+            alert = AlertRecord(
+                ts_ns=time.time_ns(),
+                title=title,
+                message=message,
+                priority=priority,
+                priority_str=priority.value,
+                data=data or {}
+            )
             
             # Store alert
             await self._store_alert(alert)
@@ -60,118 +99,135 @@ class AlertSystem:
                 tasks.append(self._send_webhook_alert(alert))
                 
             if tasks:
-                await asyncio.gather(*tasks)
+                # One failing channel must not cancel delivery on the others
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+                for result in results:
+                    if isinstance(result, Exception):
+                        self.log_warning("Alert dispatch failed: %r", result)
             
             return True
             
-        except Exception as e:
-            self.logger.error(f"Failed to trigger alert: {str(e)}")
+        except Exception:
+            self.log_exception("Failed to trigger alert")
             return False
 
     async def check_system_health(self, metrics: Dict[str, Any]) -> None:
         """Check system health and trigger alerts if needed"""
         try:
-            # Check gas price
-            if metrics.get('gas_price', 0) > self.thresholds['gas_price_threshold']:
-                await self.trigger_alert(
-                    "High Gas Price Alert",
-                    f"Current gas price: {metrics['gas_price']} Gwei",
-                    AlertPriority.HIGH
-                )
-            
-            # Check profit threshold
-            if metrics.get('profit', 0) < self.thresholds['profit_threshold']:
-                await self.trigger_alert(
-                    "Low Profit Alert",
-                    f"Current profit: {metrics['profit']} ETH",
-                    AlertPriority.MEDIUM
-                )
-            
-            # Check execution time
-            if metrics.get('execution_time', 0) > self.thresholds['execution_time_threshold']:
-                await self.trigger_alert(
-                    "Slow Execution Alert",
-                    f"Execution time: {metrics['execution_time']}s",
-                    AlertPriority.MEDIUM
-                )
+            alerts = []
+            for metric, threshold, compare, title, template, priority in self._checks:
+                value = metrics.get(metric, 0)
+                if compare(value, threshold):
+                    alerts.append(self.trigger_alert(title, template.format(value), priority))
+
+            if alerts:
+                await asyncio.gather(*alerts, return_exceptions=True)
                 
-        except Exception as e:
-            self.logger.error(f"Health check failed: {str(e)}")
+        except Exception:
+            self.log_exception("Health check failed")
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Return the shared keep-alive session, creating it on first use"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=32,
+                    limit_per_host=8,
+                    keepalive_timeout=75,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True
+                )
+            )
+        return self._session
 
-    async def _store_alert(self, alert: Dict[str, Any]) -> None:
+    @staticmethod
+    def _iso(ts_ns: int) -> str:
+        """Format an epoch-nanosecond alert timestamp as UTC ISO-8601"""
+        return datetime.fromtimestamp(ts_ns / 1e9, tz=timezone.utc).isoformat()
+
+    async def _store_alert(self, alert: AlertRecord) -> None:
         """Store alert in history"""
-        async with self._lock:
-            self.alert_history.append(alert)
-            if len(self.alert_history) > self.max_history_size:
-                self.alert_history.pop(0)
+        # Bounded deque evicts the oldest alert itself
+        self.alert_history.append(alert)
+
+    def _render_email(self, alert: AlertRecord) -> str:
+        """Build the MIME text for an email alert"""
+        msg = EmailMessage()
+        msg.set_content(alert.message)
+        
+        msg['Subject'] = self._PRIO_TAG[alert.priority] + alert.title
+        msg['From'] = self.email_config['from_email']
+        msg['To'] = self.email_config['to_email']
+        return msg.as_string()
 
-    async def _send_email_alert(self, alert: Dict[str, Any]) -> bool:
+    async def _send_email_alert(self, alert: AlertRecord) -> bool:
         """Send email alert"""
         try:
             if not self.email_config:
                 return False
                 
-            msg = EmailMessage()
-            msg.set_content(alert['message'])
-            
-            msg['Subject'] = f"[{alert['priority'].value.upper()}] {alert['title']}"
-            msg['From'] = self.email_config['from_email']
-            msg['To'] = self.email_config['to_email']
+            # MIME encoding is CPU work; keep it off the event loop
+            body = await asyncio.to_thread(self._render_email, alert)
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    self.email_config['smtp_server'],
-                    data={
-                        'api_key': self.email_config['api_key'],
-                        'message': msg.as_string()
-                    }
-                ) as response:
-                    return response.status == 200
+            session = await self._ensure_session()
+            async with session.post(
+                self.email_config['smtp_server'],
+                data={
+                    'api_key': self.email_config['api_key'],
+                    'message': body
+                }
+            ) as response:
+                return response.status == 200
                     
-        except Exception as e:
-            self.logger.error(f"Failed to send email alert: {str(e)}")
+        except Exception:
+            self.log_exception("Failed to send email alert")
             return False
 
-    async def _send_webhook_alert(self, alert: Dict[str, Any]) -> bool:
+    async def _send_webhook_alert(self, alert: AlertRecord) -> bool:
         """Send webhook alert"""
         try:
             if not self.webhook_urls:
                 return False
                 
-            webhook_url = self.webhook_urls.get(alert['priority'].value)
+            webhook_url = self.webhook_urls.get(alert.priority_str)
             if not webhook_url:
                 return False
                 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    webhook_url,
-                    json={
-                        'timestamp': alert['timestamp'].isoformat(),
-                        'title': alert['title'],
-                        'message': alert['message'],
-                        'priority': alert['priority'].value,
-                        'data': alert['data']
-                    }
-                ) as response:
-                    return response.status == 200
+            session = await self._ensure_session()
+            async with session.post(
+                webhook_url,
+                data=orjson.dumps({
+                    'timestamp': self._iso(alert.ts_ns),
+                    'title': alert.title,
+                    'message': alert.message,
+                    'priority': alert.priority_str,
+                    'data': alert.data
+                }, default=str),
+                headers=_JSON_HEADERS
+            ) as response:
+                return response.status == 200
                     
-        except Exception as e:
-            self.logger.error(f"Failed to send webhook alert: {str(e)}")
+        except Exception:
+            self.log_exception("Failed to send webhook alert")
             return False
 
     async def get_alert_history(self, 
                               priority: Optional[AlertPriority] = None,
-                              limit: int = 100) -> List[Dict[str, Any]]:
+                              limit: int = 100) -> List[AlertRecord]:
         """Get alert history with optional filtering"""
-        async with self._lock:
-            filtered_alerts = [
-                alert for alert in self.alert_history
-                if not priority or alert['priority'] == priority
-            ]
-            return filtered_alerts[-limit:]
+        # Walk newest-first so only the last `limit` matches are visited
+        newest = reversed(self.alert_history)
+        if priority:
+            newest = (alert for alert in newest if alert.priority == priority)
+        filtered_alerts = list(itertools.islice(newest, limit))
+        filtered_alerts.reverse()
+        return filtered_alerts
 
     async def cleanup(self) -> None:
         """Cleanup alert system resources"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
         self.logger.info("Alert System cleaned up successfully")
 
 
@@ -1,44 +1,79 @@
 import logging
 from typing import Dict, List, Optional
+from collections import OrderedDict
 from decimal import Decimal
 from datetime import datetime
 import asyncio
+import contextlib
 import numpy as np
 from app.core.config import config
+from app.core.execution.trade_executor import TradeExecutor
 from app.database.repository.analytics_repository import AnalyticsRepository
 
 logger = logging.getLogger(__name__)
 
+_DEC0 = Decimal(0)
+
 class AnalyticsManager:
-    def __init__(self, analytics_repo: AnalyticsRepository):
+    def __init__(self, analytics_repo: AnalyticsRepository, trade_executor: Optional[TradeExecutor] = None):
         self.analytics_repo = analytics_repo
         self.metrics: Dict[str, Dict] = {}
         self.update_interval = config.get('analytics.update_interval', 60.0)
         self.is_running = False
+        self._task: Optional[asyncio.Task] = None
+        # LRU of computed strategy performance keyed by a trade-set fingerprint
+        self._perf_cache: OrderedDict = OrderedDict()
+        self._perf_cache_size = 256
+        # Set when new trades are recorded so metrics refresh before the interval elapses;
+        # created in start() so it binds to the running loop
+        self._tick: Optional[asyncio.Event] = None
+        if trade_executor is not None:
+            trade_executor.add_trade_listener(self.notify)
+
+    def notify(self) -> None:
+        if self._tick is not None:
+            self._tick.set()
+
+    async def _wait_for_tick(self) -> None:
+        try:
+            await asyncio.wait_for(self._tick.wait(), timeout=self.update_interval)
+        except asyncio.TimeoutError:
+            pass
+        self._tick.clear()
 
     async def start(self):
         try:
+            # A second start() must not spawn a competing loop
+            if self._task and not self._task.done():
+                return
             self.is_running = True
-            asyncio.create_task(self._update_loop())
+            if self._tick is None:
+                self._tick = asyncio.Event()
+            self._task = asyncio.create_task(self._update_loop(), name="analytics-update")
             logger.info("Analytics manager started")
-        except Exception as e:
-            logger.error(f"Error starting analytics manager: {str(e)}")
+        except Exception:
+            logger.exception("Error starting analytics manager")
             self.is_running = False
 
     async def stop(self):
         try:
             self.is_running = False
+            if self._task:
+                self._task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self._task
+                self._task = None
             logger.info("Analytics manager stopped")
-        except Exception as e:
-            logger.error(f"Error stopping analytics manager: {str(e)}")
+        except Exception:
+            logger.exception("Error stopping analytics manager")
 
     async def _update_loop(self):
         while self.is_running:
             try:
                 await self._update_metrics()
-                await asyncio.sleep(self.update_interval)
-            except Exception as e:
-                logger.error(f"Error in analytics update loop: {str(e)}")
+                await self._wait_for_tick()
+            except Exception:
+                logger.exception("Error in analytics update loop")
                 await asyncio.sleep(self.update_interval)
 
     async def _update_metrics(self):
@@ -49,102 +84,116 @@ class AnalyticsManager:
             await self._calculate_risk_metrics()
             # Store metrics
             await self._store_metrics()
-        except Exception as e:
-            logger.error(f"Error updating metrics: {str(e)}")
+        except Exception:
+            logger.exception("Error updating metrics")
 
     async def calculate_strategy_performance(self, strategy_id: str, start_time: datetime, end_time: datetime) -> Dict:
         try:
             trades = await self.analytics_repo.get_strategy_trades(strategy_id, start_time, end_time)
             
             if not trades:
+                # Nothing to compute; skip the cache and the per-metric helpers
                 return {}
 
-            return {
+            cache_key = (strategy_id, start_time, end_time, len(trades), trades[-1].get('id'))
+            cached = self._perf_cache.get(cache_key)
+            if cached is not None:
+                self._perf_cache.move_to_end(cache_key)
+                return cached
+
+            # One pass over the trades into arrays; every metric reduces over those
+            soa = self._to_soa(trades)
+            pl = soa['pl']
+            performance = {
                 'total_trades': len(trades),
-                'win_rate': self._calculate_win_rate(trades),
-                'profit_loss': self._calculate_profit_loss(trades),
-                'sharpe_ratio': self._calculate_sharpe_ratio(trades),
-                'max_drawdown': self._calculate_max_drawdown(trades),
-                'average_trade_duration': self._calculate_avg_trade_duration(trades)
+                'win_rate': self._calculate_win_rate(pl),
+                'profit_loss': self._calculate_profit_loss(pl),
+                'sharpe_ratio': self._calculate_sharpe_ratio(pl),
+                'max_drawdown': self._calculate_max_drawdown(pl),
+                'average_trade_duration': self._calculate_avg_trade_duration(soa)
             }
-        except Exception as e:
-            logger.error(f"Error calculating strategy performance: {str(e)}")
+
+            self._perf_cache[cache_key] = performance
+            if len(self._perf_cache) > self._perf_cache_size:
+                self._perf_cache.popitem(last=False)
+            return performance
+        except Exception:
+            logger.exception("Error calculating strategy performance")
             return {}
 
-    def _calculate_win_rate(self, trades: List[Dict]) -> Decimal:
+    def _calculate_win_rate(self, pl: np.ndarray) -> Decimal:
         try:
-            if not trades:
-                return Decimal('0')
+            if not pl.size:
+                return _DEC0
             
-            winning_trades = sum(1 for trade in trades if trade['profit_loss'] > 0)
-            return Decimal(str(winning_trades / len(trades)))
-        except Exception as e:
-            logger.error(f"Error calculating win rate: {str(e)}")
-            return Decimal('0')
+            return Decimal(str(float((pl > 0).mean())))
+        except Exception:
+            logger.exception("Error calculating win rate")
+            return _DEC0
 
-    def _calculate_profit_loss(self, trades: List[Dict]) -> Decimal:
+    def _calculate_profit_loss(self, pl: np.ndarray) -> Decimal:
         try:
-            return sum(Decimal(str(trade['profit_loss'])) for trade in trades)
-        except Exception as e:
-            logger.error(f"Error calculating profit/loss: {str(e)}")
-            return Decimal('0')
-
-    def _calculate_sharpe_ratio(self, trades: List[Dict], risk_free_rate: float = 0.02) -> float:
+            # Sum in float64 and only convert the aggregate to Decimal
+            return Decimal(repr(float(pl.sum())))
+        except Exception:
+            logger.exception("Error calculating profit/loss")
+            return _DEC0
+
+    def _to_soa(self, trades: List[Dict]) -> Dict[str, np.ndarray]:
+        n = len(trades)
+        pl = np.empty(n, dtype=np.float64)
+        duration = np.zeros(n, dtype=np.float64)
+        has_times = np.zeros(n, dtype=bool)
+        for i, trade in enumerate(trades):
+            pl[i] = float(trade['profit_loss'])
+            open_time, close_time = trade.get('open_time'), trade.get('close_time')
+            if open_time and close_time:
+                duration[i] = (close_time - open_time).total_seconds()
+                has_times[i] = True
+        return {'pl': pl, 'duration': duration, 'has_times': has_times}
+
+    def _calculate_sharpe_ratio(self, pl: np.ndarray, risk_free_rate: float = 0.02) -> float:
         try:
-            if not trades:
+            if not pl.size:
                 return 0.0
 
-            returns = [float(trade['profit_loss']) for trade in trades]
-            excess_returns = np.array(returns) - risk_free_rate
-            return float(np.mean(excess_returns) / np.std(excess_returns) if np.std(excess_returns) != 0 else 0)
-        except Exception as e:
-            logger.error(f"Error calculating Sharpe ratio: {str(e)}")
+            std = pl.std()
+            return float((pl.mean() - risk_free_rate) / std) if std != 0 else 0.0
+        except Exception:
+            logger.exception("Error calculating Sharpe ratio")
             return 0.0
 
-    def _calculate_max_drawdown(self, trades: List[Dict]) -> Decimal:
+    def _calculate_max_drawdown(self, pl: np.ndarray) -> Decimal:
         try:
-            if not trades:
-                return Decimal('0')
-
-            cumulative = [Decimal('0')]
-            for trade in trades:
-                cumulative.append(cumulative[-1] + Decimal(str(trade['profit_loss'])))
+            if not pl.size:
+                return _DEC0
+
+            cumulative = np.cumsum(pl)
+            peaks = np.maximum.accumulate(cumulative)
+            drawdowns = np.divide(
+                peaks - cumulative,
+                peaks,
+                out=np.zeros_like(cumulative),
+                where=peaks > 0
+            )
+            return Decimal(repr(float(drawdowns.max())))
+        except Exception:
+            logger.exception("Error calculating max drawdown")
+            return _DEC0
 
-            max_dd = Decimal('0')
-            peak = cumulative[0]
-            
-            for value in cumulative[1:]:
-                if value > peak:
-                    peak = value
-                dd = (peak - value) / peak if peak > 0 else Decimal('0')
-                max_dd = max(max_dd, dd)
-
-            return max_dd
-        except Exception as e:
-            logger.error(f"Error calculating max drawdown: {str(e)}")
-            return Decimal('0')
-
-    def _calculate_avg_trade_duration(self, trades: List[Dict]) -> float:
+    def _calculate_avg_trade_duration(self, soa: Dict[str, np.ndarray]) -> float:
         try:
-            if not trades:
-                return 0.0
-
-            durations = [
-                (trade['close_time'] - trade['open_time']).total_seconds()
-                for trade in trades
-                if trade.get('close_time') and trade.get('open_time')
-            ]
-            
-            return float(sum(durations) / len(durations)) if durations else 0.0
-        except Exception as e:
-            logger.error(f"Error calculating average trade duration: {str(e)}")
+            durations = soa['duration'][soa['has_times']]
+            return float(durations.mean()) if durations.size else 0.0
+        except Exception:
+            logger.exception("Error calculating average trade duration")
             return 0.0
 
     async def get_portfolio_metrics(self, portfolio_id: str) -> Dict:
         try:
             return self.metrics.get(portfolio_id, {})
-        except Exception as e:
-            logger.error(f"Error getting portfolio metrics: {str(e)}")
+        except Exception:
+            logger.exception("Error getting portfolio metrics")
             return {}
 
     async def get_historical_metrics(
@@ -159,14 +208,18 @@ class AnalyticsManager:
                 start_time,
                 end_time
             )
-        except Exception as e:
-            logger.error(f"Error getting historical metrics: {str(e)}")
+        except Exception:
+            logger.exception("Error getting historical metrics")
             return []
 
     async def _store_metrics(self):
-        try:
-            for portfolio_id, metrics in self.metrics.items():
-                await self.analytics_repo.store_metrics(portfolio_id, metrics)
-        except Exception as e:
-            logger.error(f"Error storing metrics: {str(e)}")
+        # One concurrent write per portfolio; a failed write does not drop the rest
+        items = list(self.metrics.items())
+        results = await asyncio.gather(
+            *(self.analytics_repo.store_metrics(pid, m) for pid, m in items),
+            return_exceptions=True
+        )
+        for (portfolio_id, _), result in zip(items, results):
+            if isinstance(result, Exception):
+                logger.error("Error storing metrics for %s", portfolio_id, exc_info=result)
 
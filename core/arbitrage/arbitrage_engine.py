@@ -3,6 +3,7 @@ from typing import Dict, List, Optional
 from decimal import Decimal
 from datetime import datetime
 import asyncio
+import contextlib
 from app.core.config import config
 from app.core.market.market_data_manager import MarketDataManager
 from app.core.execution.execution_manager import ExecutionManager
@@ -21,25 +22,51 @@ class ArbitrageEngine:
         self.execution_manager = execution_manager
         self.arbitrage_repo = arbitrage_repo
         self.is_running = False
+        self._task: Optional[asyncio.Task] = None
         self.scan_interval = config.get('arbitrage.scan_interval', 1.0)
         self.min_profit_threshold = config.get('arbitrage.min_profit_threshold', Decimal('0.001'))
         self.active_opportunities: Dict[str, Dict] = {}
+        # Set on new market data so a scan runs without waiting out the interval;
+        # created in start() so it binds to the running loop
+        self._tick: Optional[asyncio.Event] = None
+        self.market_data_manager.add_update_listener(self.notify)
+
+    def notify(self) -> None:
+        if self._tick is not None:
+            self._tick.set()
+
+    async def _wait_for_tick(self) -> None:
+        try:
+            await asyncio.wait_for(self._tick.wait(), timeout=self.scan_interval)
+        except asyncio.TimeoutError:
+            pass
+        self._tick.clear()
 
     async def start(self):
         try:
+            # A second start() must not spawn a competing loop
+            if self._task and not self._task.done():
+                return
             self.is_running = True
-            asyncio.create_task(self._scan_loop())
+            if self._tick is None:
+                self._tick = asyncio.Event()
+            self._task = asyncio.create_task(self._scan_loop(), name="arbitrage-scan")
             logger.info("Arbitrage engine started")
-        except Exception as e:
-            logger.error(f"Error starting arbitrage engine: {str(e)}")
+        except Exception:
+            logger.exception("Error starting arbitrage engine")
             self.is_running = False
 
     async def stop(self):
         try:
             self.is_running = False
+            if self._task:
+                self._task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self._task
+                self._task = None
             logger.info("Arbitrage engine stopped")
-        except Exception as e:
-            logger.error(f"Error stopping arbitrage engine: {str(e)}")
+        except Exception:
+            logger.exception("Error stopping arbitrage engine")
 
     async def _scan_loop(self):
         while self.is_running:
@@ -54,39 +81,35 @@ class ArbitrageEngine:
                 for opportunity in profitable_opportunities:
                     await self._execute_opportunity(opportunity)
                 
-                await asyncio.sleep(self.scan_interval)
+                await self._wait_for_tick()
 
-            except Exception as e:
-                logger.error(f"Error in arbitrage scan loop: {str(e)}")
+            except Exception:
+                logger.exception("Error in arbitrage scan loop")
                 await asyncio.sleep(self.scan_interval)
 
     async def _scan_opportunities(self) -> List[Dict]:
         try:
-            opportunities = []
-            
             # Get market data for all relevant pairs
             market_data = await self._get_market_data()
             
-            # Find triangular arbitrage opportunities
-            triangular_opportunities = await self._find_triangular_arbitrage(market_data)
-            opportunities.extend(triangular_opportunities)
-            
-            # Find cross-exchange arbitrage opportunities
-            cross_exchange_opportunities = await self._find_cross_exchange_arbitrage(market_data)
-            opportunities.extend(cross_exchange_opportunities)
+            # Triangular and cross-exchange searches are independent; run them together
+            triangular_opportunities, cross_exchange_opportunities = await asyncio.gather(
+                self._find_triangular_arbitrage(market_data),
+                self._find_cross_exchange_arbitrage(market_data)
+            )
             
-            return opportunities
+            return [*triangular_opportunities, *cross_exchange_opportunities]
 
-        except Exception as e:
-            logger.error(f"Error scanning opportunities: {str(e)}")
+        except Exception:
+            logger.exception("Error scanning opportunities")
             return []
 
     async def _get_market_data(self) -> Dict:
         try:
             # Implement market data fetching logic
             return {}
-        except Exception as e:
-            logger.error(f"Error getting market data: {str(e)}")
+        except Exception:
+            logger.exception("Error getting market data")
             return {}
 
     async def _find_triangular_arbitrage(self, market_data: Dict) -> List[Dict]:
@@ -94,8 +117,8 @@ class ArbitrageEngine:
             opportunities = []
             # Implement triangular arbitrage detection logic
             return opportunities
-        except Exception as e:
-            logger.error(f"Error finding triangular arbitrage: {str(e)}")
+        except Exception:
+            logger.exception("Error finding triangular arbitrage")
             return []
 
     async def _find_cross_exchange_arbitrage(self, market_data: Dict) -> List[Dict]:
@@ -103,32 +126,37 @@ class ArbitrageEngine:
             opportunities = []
             # Implement cross-exchange arbitrage detection logic
             return opportunities
-        except Exception as e:
-            logger.error(f"Error finding cross-exchange arbitrage: {str(e)}")
+        except Exception:
+            logger.exception("Error finding cross-exchange arbitrage")
             return []
 
     async def _filter_profitable_opportunities(self, opportunities: List[Dict]) -> List[Dict]:
         try:
+            profits = await asyncio.gather(
+                *(self._calculate_profit(opportunity) for opportunity in opportunities),
+                return_exceptions=True
+            )
+
             profitable = []
-            
-            for opportunity in opportunities:
-                profit = await self._calculate_profit(opportunity)
-                if profit > self.min_profit_threshold:
+            for opportunity, profit in zip(opportunities, profits):
+                if isinstance(profit, Exception):
+                    logger.error("Error calculating profit", exc_info=profit)
+                elif profit > self.min_profit_threshold:
                     opportunity['estimated_profit'] = profit
                     profitable.append(opportunity)
             
             return profitable
 
-        except Exception as e:
-            logger.error(f"Error filtering profitable opportunities: {str(e)}")
+        except Exception:
+            logger.exception("Error filtering profitable opportunities")
             return []
 
     async def _calculate_profit(self, opportunity: Dict) -> Decimal:
         try:
             # Implement profit calculation logic
             return Decimal('0')
-        except Exception as e:
-            logger.error(f"Error calculating profit: {str(e)}")
+        except Exception:
+            logger.exception("Error calculating profit")
             return Decimal('0')
 
     async def _execute_opportunity(self, opportunity: Dict):
@@ -151,29 +179,29 @@ class ArbitrageEngine:
                 updated_at=datetime.utcnow()
             )
 
-        except Exception as e:
-            logger.error(f"Error executing opportunity: {str(e)}")
+        except Exception:
+            logger.exception("Error executing opportunity")
 
     async def _execute_trades(self, opportunity: Dict) -> bool:
         try:
             # Implement trade execution logic
             return False
-        except Exception as e:
-            logger.error(f"Error executing trades: {str(e)}")
+        except Exception:
+            logger.exception("Error executing trades")
             return False
 
     async def get_active_opportunities(self) -> List[Dict]:
         try:
             return list(self.active_opportunities.values())
-        except Exception as e:
-            logger.error(f"Error getting active opportunities: {str(e)}")
+        except Exception:
+            logger.exception("Error getting active opportunities")
             return []
 
     async def get_opportunity_status(self, opportunity_id: str) -> Optional[Dict]:
         try:
             return await self.arbitrage_repo.get_by_id(opportunity_id)
-        except Exception as e:
-            logger.error(f"Error getting opportunity status: {str(e)}")
+        except Exception:
+            logger.exception("Error getting opportunity status")
             return None
 
 
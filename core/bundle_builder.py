@@ -1,8 +1,11 @@
 import logging
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
 from decimal import Decimal
-from datetime import datetime
 import asyncio
+import contextlib
+import graphlib
+import time
+import uuid
 from app.core.config import config
 from app.core.mempool.mempool_scanner import MempoolScanner
 from app.core.gas.gas_optimizer import GasOptimizer
@@ -10,7 +13,36 @@ from app.database.repository.bundle_repository import BundleRepository
 
 logger = logging.getLogger(__name__)
 
+_now_ns = time.time_ns
+
+class Tx(NamedTuple):
+    """Validated transaction fields used while ordering and pricing a bundle"""
+    from_: str
+    to: Optional[str]
+    nonce: int
+    gas_price: int
+    gas_limit: int
+    value: int
+    data: Any
+    raw: Dict
+
 class BundleBuilder:
+    __slots__ = (
+        'mempool_scanner',
+        'gas_optimizer',
+        'bundle_repo',
+        'active_bundles',
+        '_bundles_snapshot',
+        'min_profit_threshold',
+        'max_transactions_per_bundle',
+        'write_batch_size',
+        'worker_count',
+        '_pending',
+        '_writer_task',
+        '_candidates',
+        '_workers'
+    )
+
     def __init__(
         self,
         mempool_scanner: MempoolScanner,
@@ -21,21 +53,87 @@ class BundleBuilder:
         self.gas_optimizer = gas_optimizer
         self.bundle_repo = bundle_repo
         self.active_bundles: Dict[str, Dict] = {}
-        self.min_profit_threshold = config.get('bundle.min_profit_threshold', Decimal('0.1'))
-        self.max_transactions_per_bundle = config.get('bundle.max_transactions', 3)
+        # Read-only view for get_all_bundles, rebuilt after active_bundles changes
+        self._bundles_snapshot: Optional[Tuple[Dict, ...]] = None
+        # YAML yields floats; coerce once so create_bundle compares Decimal to Decimal
+        self.min_profit_threshold = Decimal(str(config.get('bundle.min_profit_threshold', '0.1')))
+        self.max_transactions_per_bundle = int(config.get('bundle.max_transactions', 3))
+        # Write-behind persistence; created on first use so they bind to the running loop
+        self.write_batch_size = int(config.get('bundle.write_batch_size', 100))
+        self._pending: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        # Candidate transaction sets fed by the mempool side, built by worker tasks
+        self.worker_count = int(config.get('bundle.workers', 4))
+        self._candidates: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+
+    async def start(self):
+        try:
+            if self._workers:
+                return
+            self._candidates = asyncio.Queue(maxsize=int(config.get('bundle.candidate_queue_size', 1024)))
+            self._workers = [
+                asyncio.create_task(self._consume(), name=f"bundle-worker-{i}")
+                for i in range(self.worker_count)
+            ]
+            logger.info("Bundle builder started")
+        except Exception as e:
+            logger.error(f"Error starting bundle builder: {str(e)}")
+
+    async def stop(self):
+        try:
+            # Build whatever was already fed before tearing the workers down
+            if self._candidates is not None and self._workers:
+                await self._candidates.join()
+            for worker in self._workers:
+                worker.cancel()
+            for worker in self._workers:
+                with contextlib.suppress(asyncio.CancelledError):
+                    await worker
+            self._workers = []
+            await self.flush()
+            # The writer idles on the empty queue once flushed; retire it too
+            if self._writer_task is not None:
+                self._writer_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self._writer_task
+                self._writer_task = None
+            logger.info("Bundle builder stopped")
+        except Exception as e:
+            logger.error(f"Error stopping bundle builder: {str(e)}")
+
+    def feed(self, transactions: List[Dict]) -> bool:
+        """Queue a candidate transaction set; returns False when the builder is saturated"""
+        if self._candidates is None:
+            logger.warning("Bundle builder is not started")
+            return False
+        try:
+            self._candidates.put_nowait(transactions)
+            return True
+        except asyncio.QueueFull:
+            logger.warning("Bundle candidate queue full, dropping transaction set")
+            return False
+
+    async def _consume(self) -> None:
+        while True:
+            transactions = await self._candidates.get()
+            try:
+                await self.create_bundle(transactions)
+            finally:
+                self._candidates.task_done()
 
     async def create_bundle(self, transactions: List[Dict]) -> Optional[Dict]:
         try:
             # Validate and optimize transactions
-            if not await self._validate_transactions(transactions):
+            if not self._validate_transactions(transactions):
                 logger.warning("Invalid transaction bundle")
                 return None
 
             # Optimize transaction ordering
-            optimized_txs = await self._optimize_transaction_order(transactions)
+            optimized_txs = self._optimize_transaction_order(self._normalize(transactions))
             
             # Calculate bundle metrics
-            metrics = await self._calculate_bundle_metrics(optimized_txs)
+            metrics = self._calculate_bundle_metrics(optimized_txs)
             
             if metrics['expected_profit'] < self.min_profit_threshold:
                 logger.info("Bundle profit below threshold")
@@ -43,37 +141,69 @@ class BundleBuilder:
 
             # Create bundle
             bundle = {
-                'transactions': optimized_txs,
+                'id': uuid.uuid4().hex,
+                'transactions': [tx.raw for tx in optimized_txs],
                 'metrics': metrics,
                 'status': 'PENDING',
-                'created_at': datetime.utcnow()
+                'created_at_ns': _now_ns()
             }
 
-            # Store bundle
-            stored_bundle = await self.bundle_repo.save_bundle(bundle)
-            if stored_bundle:
-                self.active_bundles[stored_bundle['id']] = stored_bundle
-                logger.info(f"Created bundle {stored_bundle['id']}")
+            # Persisted by the writer task; the caller does not wait on the database
+            self.active_bundles[bundle['id']] = bundle
+            self._bundles_snapshot = None
+            self._enqueue(bundle)
+            logger.info(f"Created bundle {bundle['id']}")
 
-            return stored_bundle
+            return bundle
 
         except Exception as e:
             logger.error(f"Error creating bundle: {str(e)}")
             return None
 
-    async def _validate_transactions(self, transactions: List[Dict]) -> bool:
+    def _enqueue(self, bundle: Dict) -> None:
+        if self._pending is None:
+            self._pending = asyncio.Queue()
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._writer_loop(), name="bundle-writer")
+        self._pending.put_nowait(bundle)
+
+    async def _writer_loop(self) -> None:
+        while True:
+            batch = [await self._pending.get()]
+            while len(batch) < self.write_batch_size and not self._pending.empty():
+                batch.append(self._pending.get_nowait())
+            try:
+                results = await asyncio.gather(
+                    *(self.bundle_repo.save_bundle(bundle) for bundle in batch),
+                    return_exceptions=True
+                )
+                for bundle, result in zip(batch, results):
+                    if isinstance(result, Exception) or not result:
+                        logger.error(f"Error persisting bundle {bundle['id']}: {result!r}")
+            finally:
+                for _ in batch:
+                    self._pending.task_done()
+
+    async def flush(self) -> None:
+        """Wait until every queued bundle has been handed to the repository"""
+        if self._pending is not None and self._writer_task is not None and not self._writer_task.done():
+            await self._pending.join()
+
+    def _validate_transactions(self, transactions: List[Dict]) -> bool:
         try:
             if not transactions or len(transactions) > self.max_transactions_per_bundle:
                 return False
 
-            # Validate each transaction
+            # Field presence and per-sender nonce ordering in a single pass
+            nonces: Dict[str, int] = {}
             for tx in transactions:
-                if not await self._validate_single_transaction(tx):
+                if not ('to' in tx and 'value' in tx and 'data' in tx and 'gasLimit' in tx):
                     return False
-
-            # Check for transaction conflicts
-            if await self._has_conflicts(transactions):
-                return False
+                sender, nonce = tx['from'], tx['nonce']
+                last = nonces.get(sender)
+                if last is not None and nonce <= last:
+                    return False
+                nonces[sender] = nonce
 
             return True
 
@@ -81,107 +211,82 @@ class BundleBuilder:
             logger.error(f"Error validating transactions: {str(e)}")
             return False
 
-    async def _validate_single_transaction(self, transaction: Dict) -> bool:
-        try:
-            required_fields = ['to', 'value', 'data', 'gasLimit']
-            return all(field in transaction for field in required_fields)
-        except Exception as e:
-            logger.error(f"Error validating single transaction: {str(e)}")
-            return False
-
-    async def _has_conflicts(self, transactions: List[Dict]) -> bool:
-        try:
-            # Check for nonce conflicts
-            nonces = {}
-            for tx in transactions:
-                if tx['from'] in nonces and tx['nonce'] <= nonces[tx['from']]:
-                    return True
-                nonces[tx['from']] = tx['nonce']
-
-            return False
-
-        except Exception as e:
-            logger.error(f"Error checking conflicts: {str(e)}")
-            return True
-
-    async def _optimize_transaction_order(self, transactions: List[Dict]) -> List[Dict]:
+    @staticmethod
+    def _normalize(transactions: List[Dict]) -> List[Tx]:
+        # Read each field once; callers have already validated presence.
+        # Gas and wei amounts are integral, so totals stay in int arithmetic
+        return [
+            Tx(tx['from'], tx['to'], int(tx['nonce']), int(tx.get('gasPrice', 0)),
+               int(tx['gasLimit']), int(tx['value']), tx['data'], tx)
+            for tx in transactions
+        ]
+
+    def _optimize_transaction_order(self, transactions: List[Tx]) -> List[Tx]:
         try:
             # Sort transactions by gas price and dependencies
-            sorted_txs = sorted(
-                transactions,
-                key=lambda x: (x.get('gasPrice', 0), x.get('nonce', 0))
-            )
+            sorted_txs = sorted(transactions, key=lambda x: (x.gas_price, x.nonce))
 
             # Reorder based on dependencies
-            return await self._resolve_dependencies(sorted_txs)
+            return self._resolve_dependencies(sorted_txs)
 
         except Exception as e:
             logger.error(f"Error optimizing transaction order: {str(e)}")
             return transactions
 
-    async def _resolve_dependencies(self, transactions: List[Dict]) -> List[Dict]:
+    def _resolve_dependencies(self, transactions: List[Tx]) -> List[Tx]:
         try:
-            # Build dependency graph
-            graph = {}
+            # A transaction is ordered ahead of the ones it depends on, so each
+            # dependency gets the dependent transaction as its predecessor
+            by_from: Dict[str, List[int]] = {}
             for i, tx in enumerate(transactions):
-                graph[i] = []
-                for j, other_tx in enumerate(transactions):
-                    if i != j and self._is_dependent(tx, other_tx):
-                        graph[i].append(j)
-
-            # Topological sort
-            ordered = []
-            visited = set()
-            temp = set()
-
-            def visit(i):
-                if i in temp:
-                    return  # Skip cyclic dependencies
-                if i in visited:
-                    return
-                temp.add(i)
-                for j in graph[i]:
-                    visit(j)
-                temp.remove(i)
-                visited.add(i)
-                ordered.insert(0, i)
-
-            for i in range(len(transactions)):
-                if i not in visited:
-                    visit(i)
-
-            return [transactions[i] for i in ordered]
+                by_from.setdefault(tx.from_, []).append(i)
+
+            # tx i depends on tx j if it calls j's sender, or if j is an
+            # earlier nonce from the same sender
+            predecessors = {i: [] for i in range(len(transactions))}
+            for i, tx in enumerate(transactions):
+                if tx.to is not None:
+                    for j in by_from.get(tx.to, ()):
+                        if j != i:
+                            predecessors[j].append(i)
+                for j in by_from[tx.from_]:
+                    if transactions[j].nonce < tx.nonce:
+                        predecessors[j].append(i)
+
+            try:
+                return [
+                    transactions[i]
+                    for i in graphlib.TopologicalSorter(predecessors).static_order()
+                ]
+            except graphlib.CycleError:
+                # Cyclic dependencies: keep the gas/nonce order
+                return transactions
 
         except Exception as e:
             logger.error(f"Error resolving dependencies: {str(e)}")
             return transactions
 
-    def _is_dependent(self, tx1: Dict, tx2: Dict) -> bool:
+    def _calculate_bundle_metrics(self, transactions: List[Tx]) -> Dict:
         try:
-            # Check if tx1 depends on tx2
-            return tx1.get('to') == tx2.get('from') or tx1.get('nonce', 0) > tx2.get('nonce', 0)
-        except Exception as e:
-            logger.error(f"Error checking dependency: {str(e)}")
-            return False
-
-    async def _calculate_bundle_metrics(self, transactions: List[Dict]) -> Dict:
-        try:
-            total_gas = sum(tx.get('gasLimit', 0) for tx in transactions)
-            total_value = sum(tx.get('value', 0) for tx in transactions)
+            total_gas = 0
+            total_value = 0
+            for tx in transactions:
+                total_gas += tx.gas_limit
+                total_value += tx.value
             
             return {
                 'total_gas': total_gas,
                 'total_value': total_value,
                 'transaction_count': len(transactions),
                 'expected_profit': Decimal('0'),  # To be calculated based on simulation
-                'risk_score': await self._calculate_risk_score(transactions)
+                'risk_score': self._calculate_risk_score(transactions)
             }
 
         except Exception as e:
             logger.error(f"Error calculating bundle metrics: {str(e)}")
             return {}
 
-    async def _calculate_risk_score(self, transactions: List[Dict]) -> Decimal:
+    def _calculate_risk_score(self, transactions: List[Tx]) -> Decimal:
         try:
             # Implement risk scoring logic
             return Decimal('0')
@@ -196,11 +301,13 @@ class BundleBuilder:
             logger.error(f"Error getting bundle: {str(e)}")
             return None
 
-    async def get_all_bundles(self) -> List[Dict]:
+    async def get_all_bundles(self) -> Tuple[Dict, ...]:
         try:
-            return list(self.active_bundles.values())
+            if self._bundles_snapshot is None:
+                self._bundles_snapshot = tuple(self.active_bundles.values())
+            return self._bundles_snapshot
         except Exception as e:
             logger.error(f"Error getting all bundles: {str(e)}")
-            return []
+            return ()
 
 
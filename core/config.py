@@ -1,16 +1,33 @@
 import os
+import re
 import yaml
-import json
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 import logging
-from typing import Dict, Any, Optional, List
+import sys
+import types
+import orjson
+from typing import Dict, Any, Mapping, Optional, List
 from pathlib import Path
 from pydantic import BaseModel, validator
-from web3 import Web3
-from functools import lru_cache
+from web3 import AsyncWeb3, Web3
 from threading import Lock
+from app.core.services.http_pool import get_async_web3
 
 logger = logging.getLogger(__name__)
 
+# APP_* overrides, split into config paths once; the process environment is
+# not expected to change after startup, so reload() reuses this snapshot
+_APP_ENV = [
+    (key[4:].lower().split("_"), value)
+    for key, value in os.environ.items()
+    if key.startswith("APP_")
+]
+
+_INT_VALUE = re.compile(r'[+-]?\d+')
+
 class ConfigurationError(Exception):
     """Custom exception for configuration errors"""
     pass
@@ -64,39 +81,51 @@ class Config:
     def __init__(self):
         if not hasattr(self, '_initialized'):
             self._config: Dict[str, Any] = {}
+            self._flat: Dict[str, Any] = {}
             self._env = os.getenv("APP_ENV", "development")
             self._config_dir = Path(__file__).parent.parent.parent / "config"
             self._contracts: Dict[str, Any] = {}
-            self._abis: Dict[str, Any] = {}
+            self._abis: Mapping[str, Any] = types.MappingProxyType({})
             self._load_config()
             self._initialized = True
 
     def _load_config(self) -> None:
+        # Build the new view in locals; readers keep the previous one until the swap
         try:
             base_config = self._load_yaml("base.yaml")
             env_config = self._load_yaml(f"{self._env}.yaml")
-            self._config = self._deep_merge(base_config, env_config)
-            self._apply_env_overrides()
-            self._load_contract_abis()
-            self._validate_config()
-            logger.info(f"Configuration loaded successfully for environment: {self._env}")
+            config = self._deep_merge(base_config, env_config)
+            self._apply_env_overrides(config)
+            flat = self._flatten(config)
+            abis = self._load_contract_abis()
+            self._validate_config(flat)
         except Exception as e:
             raise ConfigurationError(f"Failed to load configuration: {str(e)}")
 
+        with self._lock:
+            self._config = config
+            self._flat = flat
+            self._abis = abis
+            self._contracts = {}
+        logger.info(f"Configuration loaded successfully for environment: {self._env}")
+
     def _load_yaml(self, filename: str) -> Dict[str, Any]:
         try:
             config_path = self._config_dir / filename
             with open(config_path) as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=SafeLoader)
         except Exception as e:
             raise ConfigurationError(f"Failed to load {filename}: {str(e)}")
 
-    def _load_contract_abis(self) -> None:
+    def _load_contract_abis(self) -> Mapping[str, Any]:
         abi_dir = Path(__file__).parent.parent / "abis"
+        abis = {}
         try:
             for abi_file in abi_dir.glob("*.json"):
-                with open(abi_file) as f:
-                    self._abis[abi_file.stem] = json.load(f)
+                with open(abi_file, 'rb') as f:
+                    abis[sys.intern(abi_file.stem)] = orjson.loads(f.read())
+            # Shared with every caller of get_contract_abi, so hand out a read-only view
+            return types.MappingProxyType(abis)
         except Exception as e:
             raise ConfigurationError(f"Failed to load contract ABIs: {str(e)}")
 
@@ -109,11 +138,9 @@ class Config:
                 result[key] = value
         return result
 
-    def _apply_env_overrides(self) -> None:
-        for key, value in os.environ.items():
-            if key.startswith("APP_"):
-                path = key[4:].lower().split("_")
-                self._set_nested(self._config, path, value)
+    def _apply_env_overrides(self, config: Dict[str, Any]) -> None:
+        for path, value in _APP_ENV:
+            self._set_nested(config, path, value)
 
     def _set_nested(self, config: Dict, path: list, value: Any) -> None:
         for key in path[:-1]:
@@ -124,6 +151,10 @@ class Config:
     def _convert_value(value: str) -> Any:
         if value.lower() in ('true', 'false'):
             return value.lower() == 'true'
+        # Plain integers skip the exception path; anything else int() accepts
+        # (whitespace, '1_000') still goes through the original fallbacks
+        if _INT_VALUE.fullmatch(value):
+            return int(value)
         try:
             return int(value)
         except ValueError:
@@ -132,25 +163,28 @@ class Config:
             except ValueError:
                 return value
 
-    def _validate_config(self) -> None:
+    def _validate_config(self, flat: Dict[str, Any]) -> None:
         try:
-            DatabaseConfig(**self.get('database', {}))
-            Web3Config(**self.get('web3', {}))
-            MonitoringConfig(**self.get('monitoring', {}))
-            for strategy in self.get('strategies', {}).values():
+            DatabaseConfig(**flat.get('database', {}))
+            Web3Config(**flat.get('web3', {}))
+            MonitoringConfig(**flat.get('monitoring', {}))
+            for strategy in flat.get('strategies', {}).values():
                 StrategyConfig(**strategy)
         except Exception as e:
             raise ConfigurationError(f"Configuration validation failed: {str(e)}")
 
-    @lru_cache()
+    def _flatten(self, config: Dict[str, Any], prefix: str = "") -> Dict[str, Any]:
+        # Dotted key -> value, including intermediate sections so get('web3') still works
+        flat = {}
+        for key, value in config.items():
+            path = f"{prefix}{key}"
+            flat[path] = value
+            if isinstance(value, dict):
+                flat.update(self._flatten(value, f"{path}."))
+        return flat
+
     def get(self, key: str, default: Any = None) -> Any:
-        current = self._config
-        for part in key.split('.'):
-            if isinstance(current, dict):
-                current = current.get(part, default)
-            else:
-                return default
-        return current
+        return self._flat.get(key, default)
 
     def get_web3_provider(self) -> Web3:
         provider_url = self.get('web3.provider_url')
@@ -159,17 +193,20 @@ class Config:
             request_kwargs={'timeout': self.get('web3.request_timeout', 30)}
         ))
 
+    async def get_async_web3_provider(self) -> AsyncWeb3:
+        """Shared AsyncWeb3 for the configured endpoint; pass this one instance to every component"""
+        return await get_async_web3(
+            self.get('web3.provider_url'),
+            timeout=self.get('web3.request_timeout', 30)
+        )
+
     def get_contract_abi(self, contract_name: str) -> Dict:
         if contract_name not in self._abis:
             raise ConfigurationError(f"ABI not found for contract: {contract_name}")
         return self._abis[contract_name]
 
     def reload(self) -> None:
-        with self._lock:
-            self._config.clear()
-            self._contracts.clear()
-            self._abis.clear()
-            self._load_config()
+        self._load_config()
         logger.info("Configuration reloaded successfully")
 
     def get_all(self) -> Dict[str, Any]:
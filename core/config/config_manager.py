@@ -2,13 +2,30 @@ import logging
 from typing import Dict, Any, Optional
 from datetime import datetime
 import asyncio
-import json
+import copy
 import yaml
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 from pathlib import Path
 from app.database.repository.config_repository import ConfigRepository
 
 logger = logging.getLogger(__name__)
 
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+def _is_json(value: Any) -> bool:
+    """Structural check that value would survive json.dumps, without serializing it"""
+    if isinstance(value, _JSON_SCALARS):
+        return True
+    if isinstance(value, (list, tuple)):
+        return all(_is_json(item) for item in value)
+    if isinstance(value, dict):
+        # json.dumps also coerces scalar keys to strings
+        return all(isinstance(k, _JSON_SCALARS) and _is_json(v) for k, v in value.items())
+    return False
+
 class ConfigManager:
     def __init__(self, config_repo: ConfigRepository):
         self.config_repo = config_repo
@@ -16,6 +33,7 @@ class ConfigManager:
         self.default_config_path = Path("config/default_config.yaml")
         self.environment = "development"
         self.is_running = False
+        self._default_cache: Optional[Dict] = None
 
     async def start(self):
         try:
@@ -36,8 +54,9 @@ class ConfigManager:
 
     async def _load_configs(self):
         try:
-            # Load default configs
-            default_configs = self._load_yaml_config(self.default_config_path)
+            # Load default configs; keep a pristine parsed copy for reset_to_default
+            self._default_cache = self._load_yaml_config(self.default_config_path)
+            default_configs = copy.deepcopy(self._default_cache)
             
             # Load environment-specific configs
             env_config_path = Path(f"config/{self.environment}_config.yaml")
@@ -57,7 +76,7 @@ class ConfigManager:
     def _load_yaml_config(self, config_path: Path) -> Dict:
         try:
             with open(config_path, 'r') as file:
-                return yaml.safe_load(file)
+                return yaml.load(file, Loader=SafeLoader) or {}
         except Exception as e:
             logger.error(f"Error loading YAML config from {config_path}: {str(e)}")
             return {}
@@ -105,9 +124,8 @@ class ConfigManager:
     def _validate_config_value(self, value: Any) -> bool:
         try:
             # Ensure value is JSON serializable
-            json.dumps(value)
-            return True
-        except Exception:
+            return _is_json(value)
+        except RecursionError:
             return False
 
     async def delete_config(self, key: str) -> bool:
@@ -150,19 +168,26 @@ class ConfigManager:
 
     def _get_default_config_value(self, key: str) -> Optional[Any]:
         try:
-            default_configs = self._load_yaml_config(self.default_config_path)
-            return default_configs.get(key)
+            if self._default_cache is None:
+                self._default_cache = self._load_yaml_config(self.default_config_path)
+            return self._default_cache.get(key)
         except Exception as e:
             logger.error(f"Error getting default config value for key {key}: {str(e)}")
             return None
 
+    def reload_defaults(self) -> None:
+        """Drop the parsed default config so the next lookup re-reads it from disk"""
+        self._default_cache = None
+
     async def _save_configs(self):
         try:
+            # One timestamp for the whole save rather than one per key
+            updated_at = datetime.utcnow()
             for key, value in self.configs.items():
                 await self.config_repo.update_config(key, {
                     'key': key,
                     'value': value,
-                    'updated_at': datetime.utcnow()
+                    'updated_at': updated_at
                 })
             logger.info("Configurations saved successfully")
         except Exception as e:
@@ -1,13 +1,19 @@
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Deque, Dict, Any
+import itertools
 import logging
 import traceback
-from datetime import datetime
+import time
 import asyncio
+from collections import deque
 from dataclasses import dataclass
 
+_now_ns = time.time_ns
+
+_SEVERITY_LEVELS = {'CRITICAL': logging.CRITICAL, 'ERROR': logging.ERROR}
+
 @dataclass
 class ErrorEvent:
-    timestamp: datetime
+    timestamp_ns: int
     error_type: str
     message: str
     stack_trace: str
@@ -18,7 +24,7 @@ class ErrorHandler:
     def __init__(self, config: Dict[str, Any]):
         self.logger = logging.getLogger(__name__)
         self.config = config
-        self.error_history: list[ErrorEvent] = []
+        self.error_history: Deque[ErrorEvent] = deque(maxlen=config.get('error_handler.history_size', 1000))
         self.error_callbacks: Dict[str, Callable] = {}
         self.max_retries = config.get('error_handler.max_retries', 3)
         self.retry_delay = config.get('error_handler.retry_delay', 1)
@@ -32,11 +38,13 @@ class ErrorHandler:
     ) -> None:
         """Handle an error with optional retry logic"""
         try:
+            # Formatting the traceback is the costliest step; skip it when the log is filtered
+            level = _SEVERITY_LEVELS.get(severity, logging.WARNING)
             error_event = ErrorEvent(
-                timestamp=datetime.now(),
+                timestamp_ns=_now_ns(),
                 error_type=type(error).__name__,
                 message=str(error),
-                stack_trace=traceback.format_exc(),
+                stack_trace=traceback.format_exc() if self.logger.isEnabledFor(level) else "",
                 context=context or {},
                 severity=severity
             )
@@ -84,19 +92,14 @@ class ErrorHandler:
 
     def _log_error(self, error_event: ErrorEvent) -> None:
         """Log the error with appropriate severity"""
-        log_message = (
-            f"Error: {error_event.error_type}\n"
-            f"Message: {error_event.message}\n"
-            f"Context: {error_event.context}\n"
-            f"Stack Trace: {error_event.stack_trace}"
+        self.logger.log(
+            _SEVERITY_LEVELS.get(error_event.severity, logging.WARNING),
+            "Error: %s\nMessage: %s\nContext: %s\nStack Trace: %s",
+            error_event.error_type,
+            error_event.message,
+            error_event.context,
+            error_event.stack_trace
         )
-        
-        if error_event.severity == "CRITICAL":
-            self.logger.critical(log_message)
-        elif error_event.severity == "ERROR":
-            self.logger.error(log_message)
-        else:
-            self.logger.warning(log_message)
 
     async def _handle_critical_error(self, error_event: ErrorEvent) -> None:
         """Handle critical errors that require immediate attention"""
@@ -123,7 +126,8 @@ class ErrorHandler:
 
     def get_error_history(self, limit: int = 100) -> list[ErrorEvent]:
         """Get recent error history"""
-        return self.error_history[-limit:]
+        start = max(0, len(self.error_history) - limit)
+        return list(itertools.islice(self.error_history, start, None))
 
     def clear_error_history(self) -> None:
         """Clear error history"""
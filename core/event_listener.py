@@ -1,52 +1,119 @@
-from typing import Dict, Any, List, Optional, Callable
+from typing import Deque, Dict, Any, List, Optional, Callable, Set, Tuple
 import asyncio
+import functools
 import logging
-from web3 import Web3
+import time
+from collections import deque
+import orjson
+from hexbytes import HexBytes
+from web3 import AsyncWeb3, Web3, WebsocketProviderV2
+from web3._utils.events import get_event_data
 from web3.contract import Contract
 from web3.types import LogReceipt
 from eth_typing import Address
-from datetime import datetime
+from eth_utils import event_abi_to_log_topic, keccak
+from datetime import datetime, timezone
+
+# Swap decoders return (token_in, amount_in) from the decoded args and the
+# pool's configured (token0, token1)
+def _decode_swap_exact(args: Dict[str, Any], tokens: Tuple[str, ...]) -> Tuple[str, int]:
+    return args['tokenIn'], args['amountIn']
+
+def _decode_uniswap_v2_swap(args: Dict[str, Any], tokens: Tuple[str, ...]) -> Tuple[str, int]:
+    if args['amount0In']:
+        return tokens[0], args['amount0In']
+    return tokens[1], args['amount1In']
+
+def _decode_uniswap_v3_swap(args: Dict[str, Any], tokens: Tuple[str, ...]) -> Tuple[str, int]:
+    # Positive deltas are what the pool received
+    if args['amount0'] > 0:
+        return tokens[0], args['amount0']
+    return tokens[1], args['amount1']
+
+def _json_default(obj: Any) -> str:
+    if isinstance(obj, (bytes, bytearray)):
+        return '0x' + bytes(obj).hex()
+    return str(obj)
+
+def _json_safe(value: Any) -> Any:
+    # orjson only encodes 64-bit integers; token amounts routinely exceed that
+    if isinstance(value, int) and not -2**63 <= value < 2**64:
+        return str(value)
+    return value
+
+# Known pool Swap events by topic0; adding a DEX is one entry here
+_SWAP_DECODERS: Dict[bytes, Callable] = {
+    keccak(text='Swap(address,uint256,uint256,uint256,uint256,address)'): _decode_uniswap_v2_swap,
+    keccak(text='Swap(address,address,int256,int256,uint160,uint128,int24)'): _decode_uniswap_v3_swap,
+}
 
 class EventListener:
-    def __init__(self, w3: Web3, config: Dict[str, Any], strategy_executor):
+    def __init__(self, w3: Web3, config: Dict[str, Any], strategy_executor,
+                 async_w3: Optional[AsyncWeb3] = None, websocket_manager=None):
         self.logger = logging.getLogger(__name__)
         self.w3 = w3
+        self.async_w3 = async_w3
+        # Optional WebSocketManager that every decoded event is pushed to
+        self.websocket_manager = websocket_manager
+        self.event_channel = config.get('event_channel', 'events')
+        self.ws_url = config.get('ws_url')
         self.config = config
         self.strategy_executor = strategy_executor
-        self._lock = asyncio.Lock()
         
         # Initialize components
         self.contracts: Dict[str, Contract] = {}
         self.event_filters: Dict[str, Any] = {}
         self.event_handlers: Dict[str, Callable] = {}
-        self.event_history: List[Dict[str, Any]] = []
         self.max_history_size = config.get('max_event_history', 1000)
+        self.block_time = config.get('block_time', 12.0)
+        self.max_log_range = config.get('max_log_block_range', 2000)
+        self.event_history: Deque[Dict[str, Any]] = deque(maxlen=self.max_history_size)
         
         # Setup handlers
         self.event_handlers = {
-            'SwapExact': self._handle_swap_event,
+            'SwapExact': functools.partial(self._handle_swap_event, _decode_swap_exact, ()),
             'Liquidation': self._handle_liquidation_event,
             'FlashLoan': self._handle_flash_loan_event
         }
         
-        # Initialize contracts
+        # Initialize contracts; logs are routed by (address, topic0) to a decoder
+        self._sig_map: Dict[Tuple[str, bytes], Tuple[str, Dict[str, Any], Optional[Callable]]] = {}
+        self._addresses: List[str] = []
         self._initialize_contracts()
         
         # Background tasks
         self.running = False
         self.tasks: List[asyncio.Task] = []
+        self._handler_tasks: Set[asyncio.Task] = set()
 
     def _initialize_contracts(self) -> None:
         try:
             for contract_name, contract_config in self.config.get('contracts', {}).items():
                 contract = self.w3.eth.contract(
-                    address=Web3.toChecksumAddress(contract_config['address']),
+                    address=Web3.to_checksum_address(contract_config['address']),
                     abi=contract_config['abi']
                 )
                 self.contracts[contract_name] = contract
-                self.logger.info(f"Initialized contract: {contract_name}")
+                # Checksummed once here; dispatch only ever compares lowercase hex
+                self._addresses.append(contract.address)
+                address = contract.address.lower()
+                tokens = tuple(contract_config.get('tokens', ()))
+                for event_abi in contract.abi:
+                    if event_abi.get('type') != 'event' or event_abi.get('anonymous'):
+                        continue
+                    topic = bytes(event_abi_to_log_topic(event_abi))
+                    decoder = _SWAP_DECODERS.get(topic)
+                    if decoder is None:
+                        handler = self.event_handlers.get(event_abi['name'])
+                    elif len(tokens) >= 2:
+                        handler = functools.partial(self._handle_swap_event, decoder, tokens)
+                    else:
+                        # Pool swaps only carry amounts; without its tokens there is nothing to trade
+                        handler = None
+                    self._sig_map[(address, topic)] = (contract_name, event_abi, handler)
+                self.logger.info("Initialized contract: %s", contract_name)
         except Exception as e:
-            self.logger.error(f"Contract initialization failed: {str(e)}")
+            self.logger.error("Contract initialization failed: %s", e)
             raise
 
     async def start(self) -> None:
@@ -55,13 +122,15 @@ class EventListener:
                 return
 
             self.running = True
-            for contract_name, contract in self.contracts.items():
-                task = asyncio.create_task(self._listen_for_events(contract_name, contract))
-                self.tasks.append(task)
+            if self.contracts:
+                if self._persistent_w3() is not None or self.ws_url:
+                    self.tasks.append(asyncio.create_task(self._subscribe_to_events()))
+                else:
+                    self.tasks.append(asyncio.create_task(self._listen_for_events()))
             
             self.logger.info("Event listener started")
         except Exception as e:
-            self.logger.error(f"Failed to start listener: {str(e)}")
+            self.logger.error("Failed to start listener: %s", e)
             self.running = False
             raise
 
@@ -72,54 +141,128 @@ class EventListener:
                 task.cancel()
             await asyncio.gather(*self.tasks, return_exceptions=True)
             self.tasks = []
+            # Let in-flight handlers finish rather than dropping their trades
+            await asyncio.gather(*self._handler_tasks, return_exceptions=True)
             self.logger.info("Event listener stopped")
         except Exception as e:
-            self.logger.error(f"Failed to stop listener: {str(e)}")
+            self.logger.error("Failed to stop listener: %s", e)
+
+    def _persistent_w3(self) -> Optional[AsyncWeb3]:
+        # eth_subscribe needs a persistent socket; an HTTP AsyncWeb3 can only be polled
+        if self.async_w3 is not None and isinstance(self.async_w3.provider, WebsocketProviderV2):
+            return self.async_w3
+        return None
 
-    async def _listen_for_events(self, contract_name: str, contract: Contract) -> None:
+    async def _subscribe_to_events(self) -> None:
         try:
-            event_filter = contract.events.allEvents.createFilter(fromBlock='latest')
+            persistent_w3 = self._persistent_w3()
+            if persistent_w3 is not None:
+                await self._consume_subscription(persistent_w3)
+            else:
+                async with AsyncWeb3.persistent_websocket(WebsocketProviderV2(self.ws_url)) as w3:
+                    await self._consume_subscription(w3)
+        except asyncio.CancelledError:
+            self.logger.info("Stopped listening for events")
+            return
+        except Exception as e:
+            self.logger.warning("Log subscription failed, falling back to polling: %s", e)
+        if self.running:
+            await self._listen_for_events()
+
+    async def _consume_subscription(self, w3: AsyncWeb3) -> None:
+        # Node pushes matching logs as they land; nothing is sent on idle blocks
+        await w3.eth.subscribe('logs', {'address': self._addresses})
+        async for msg in w3.ws.listen_to_websocket():
+            if not self.running:
+                break
+            log = msg.get('result') if isinstance(msg, dict) else None
+            if log:
+                await self._dispatch_log(log)
+
+    async def _listen_for_events(self) -> None:
+        try:
+            # One eth_getLogs per head advance covers every contract
+            head_poll = min(1.0, self.block_time / 4)
+            stride = self.max_log_range
+            last_block = self.w3.eth.block_number
             while self.running:
-                events = event_filter.get_new_entries()
-                for event in events:
-                    await self._process_event(contract_name, event)
-                await asyncio.sleep(1)  # Polling interval
+                head = self.w3.eth.block_number
+                while last_block < head and self.running:
+                    to_block = min(head, last_block + stride)
+                    try:
+                        logs = self.w3.eth.get_logs({
+                            'fromBlock': last_block + 1,
+                            'toBlock': to_block,
+                            'address': self._addresses
+                        })
+                    except ValueError:
+                        # Provider rejected the range or result size; retry narrower
+                        if stride == 1:
+                            raise
+                        stride = max(1, stride // 2)
+                        continue
+                    for log in logs:
+                        await self._dispatch_log(log)
+                    last_block = to_block
+                    stride = min(self.max_log_range, stride * 2)
+                await asyncio.sleep(head_poll)
         except asyncio.CancelledError:
-            self.logger.info(f"Stopped listening to {contract_name}")
+            self.logger.info("Stopped listening for events")
         except Exception as e:
-            self.logger.error(f"Event listening error: {str(e)}")
+            self.logger.error("Event listening error: %s", e)
+
+    async def _dispatch_log(self, log: LogReceipt) -> None:
+        if not log['topics']:
+            return
+        address = log['address']
+        address = address.lower() if isinstance(address, str) else '0x' + bytes(address).hex()
+        entry = self._sig_map.get((address, bytes(HexBytes(log['topics'][0]))))
+        if entry is None:
+            return
+        contract_name, event_abi, handler = entry
+        event = get_event_data(self.w3.codec, event_abi, log)
+        await self._process_event(contract_name, event, handler)
 
-    async def _process_event(self, contract_name: str, event: LogReceipt) -> None:
+    async def _process_event(self, contract_name: str, event: LogReceipt,
+                             handler: Optional[Callable]) -> None:
         try:
-            async with self._lock:
-                event_data = {
-                    'contract': contract_name,
-                    'type': event['event'],
-                    'args': dict(event['args']),
-                    'transaction_hash': event['transactionHash'].hex(),
-                    'block_number': event['blockNumber'],
-                    'timestamp': datetime.utcnow().isoformat()
-                }
-                
-                self._store_event(event_data)
-                
-                handler = self.event_handlers.get(event['event'])
-                if handler:
-                    await handler(event_data)
-                
+            event_data = {
+                'contract': contract_name,
+                'type': event['event'],
+                'args': dict(event['args']),
+                'transaction_hash': event['transactionHash'].hex(),
+                'block_number': event['blockNumber'],
+                'timestamp_ns': time.time_ns()
+            }
+            self._store_event(event_data)
+
+            if self.websocket_manager is not None:
+                self._spawn(self.websocket_manager.send_message(
+                    self.event_channel, self.event_payload(event_data)
+                ))
+            if handler:
+                self._spawn(handler(event_data))
+
         except Exception as e:
-            self.logger.error(f"Event processing failed: {str(e)}")
+            self.logger.error("Event processing failed: %s", e)
 
-    async def _handle_swap_event(self, event_data: Dict[str, Any]) -> None:
+    def _spawn(self, coro) -> None:
+        # A slow handler or socket must not hold up ingestion of later logs
+        task = asyncio.create_task(coro)
+        self._handler_tasks.add(task)
+        task.add_done_callback(self._handler_tasks.discard)
+
+    async def _handle_swap_event(self, decode: Callable, tokens: Tuple[str, ...],
+                                 event_data: Dict[str, Any]) -> None:
         try:
-            args = event_data['args']
+            token_in, amount_in = decode(event_data['args'], tokens)
             await self.strategy_executor.execute_strategy('flash_loan_arbitrage', {
-                'token_address': args.get('tokenIn'),
-                'amount': args.get('amountIn'),
+                'token_address': token_in,
+                'amount': amount_in,
                 'exchange_address': event_data['contract']
             })
         except Exception as e:
-            self.logger.error(f"Swap event handling failed: {str(e)}")
+            self.logger.error("Swap event handling failed: %s", e)
 
     async def _handle_liquidation_event(self, event_data: Dict[str, Any]) -> None:
         try:
@@ -130,33 +273,52 @@ class EventListener:
                 'exchange_address': event_data['contract']
             })
         except Exception as e:
-            self.logger.error(f"Liquidation event handling failed: {str(e)}")
+            self.logger.error("Liquidation event handling failed: %s", e)
 
     async def _handle_flash_loan_event(self, event_data: Dict[str, Any]) -> None:
         try:
             # Implement flash loan handling logic
             pass
         except Exception as e:
-            self.logger.error(f"Flash loan event handling failed: {str(e)}")
+            self.logger.error("Flash loan event handling failed: %s", e)
 
     def _store_event(self, event_data: Dict[str, Any]) -> None:
         try:
+            # Bounded deque evicts the oldest event itself
             self.event_history.append(event_data)
-            if len(self.event_history) > self.max_history_size:
-                self.event_history.pop(0)
         except Exception as e:
-            self.logger.error(f"Event storage failed: {str(e)}")
+            self.logger.error("Event storage failed: %s", e)
+
+    @staticmethod
+    def event_payload(event_data: Dict[str, Any]) -> bytes:
+        """JSON encoding of an event, built on first use and shared by every sink"""
+        raw = event_data.get('_raw')
+        if raw is None:
+            body = dict(event_data)
+            body['args'] = {key: _json_safe(value) for key, value in event_data['args'].items()}
+            raw = event_data['_raw'] = orjson.dumps(body, default=_json_default)
+        return raw
 
     async def get_event_history(self) -> List[Dict[str, Any]]:
-        async with self._lock:
-            return self.event_history.copy()
+        return self._format_history(list(self.event_history))
+
+    @staticmethod
+    def _format_history(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        # Timestamps are kept as epoch ns on ingest and only rendered for readers
+        formatted = []
+        for entry in entries:
+            entry = dict(entry)
+            ts_ns = entry.pop('timestamp_ns')
+            entry.pop('_raw', None)
+            entry['timestamp'] = datetime.fromtimestamp(ts_ns / 1e9, tz=timezone.utc).isoformat()
+            formatted.append(entry)
+        return formatted
 
     async def cleanup(self) -> None:
         try:
             await self.stop()
-            async with self._lock:
-                self.event_history = []
+            self.event_history = deque(maxlen=self.max_history_size)
             self.logger.info("Event listener cleaned up")
         except Exception as e:
-            self.logger.error(f"Cleanup failed: {str(e)}")
+            self.logger.error("Cleanup failed: %s", e)
 
@@ -1,24 +1,47 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 import logging
 import asyncio
+import contextlib
+import time
+from dataclasses import dataclass
 from web3 import Web3
+from app.core.config import config
 from app.core.gas.gas_optimizer import GasOptimizer
 from app.core.blockchain.blockchain import Blockchain
+from app.core.services.receipt_watcher import ReceiptWatcher
 from app.database.repository.transaction_repository import TransactionRepository
 
 logger = logging.getLogger(__name__)
 
+@dataclass
+class PendingTx:
+    # Explicit slots: one of these lives per in-flight transaction
+    __slots__ = ('tx_hash', 'gas_price', 'gas_limit', 'created_ns', 'status')
+    tx_hash: str
+    gas_price: int
+    gas_limit: int
+    created_ns: int
+    status: str
+
 class ExecutionManager:
     def __init__(
         self,
         blockchain: Blockchain,
         gas_optimizer: GasOptimizer,
-        transaction_repo: TransactionRepository
+        transaction_repo: TransactionRepository,
+        receipt_watcher: Optional[ReceiptWatcher] = None
     ):
         self.blockchain = blockchain
         self.gas_optimizer = gas_optimizer
         self.transaction_repo = transaction_repo
-        self.pending_transactions: Dict[str, Dict] = {}
+        self.pending_transactions: Dict[str, PendingTx] = {}
+        # One shared head-following loop resolves receipts for every pending transaction
+        self.receipt_watcher = receipt_watcher or ReceiptWatcher(blockchain.web3, timeout=300)
+        # Write-behind queue for transaction records, flushed in batches
+        self.flush_batch = config.get('execution.flush_batch', 256)
+        self.flush_interval = config.get('execution.flush_ms', 5) / 1000
+        self._write_q: Optional[asyncio.Queue] = None
+        self._flusher_task: Optional[asyncio.Task] = None
 
     async def execute_transaction(self, transaction: Dict) -> Optional[str]:
         try:
@@ -29,71 +52,132 @@ class ExecutionManager:
             tx_hash = await self.blockchain.send_transaction(optimized_tx)
             
             # Store transaction details
-            await self.transaction_repo.create(
+            self._queue_write('create', dict(
                 tx_hash=tx_hash,
                 status='PENDING',
                 gas_price=optimized_tx['maxFeePerGas'],
                 gas_limit=optimized_tx['gas']
-            )
+            ))
             
-            self.pending_transactions[tx_hash] = optimized_tx
+            self.pending_transactions[tx_hash] = PendingTx(
+                tx_hash,
+                int(optimized_tx['maxFeePerGas']),
+                int(optimized_tx['gas']),
+                time.monotonic_ns(),
+                'PENDING'
+            )
             
             # Start monitoring the transaction
             asyncio.create_task(self._monitor_transaction(tx_hash))
             
-            logger.info(f"Transaction sent: {tx_hash}")
+            logger.info("Transaction sent: %s", tx_hash)
             return tx_hash
 
         except Exception as e:
-            logger.error(f"Error executing transaction: {str(e)}")
+            logger.error("Error executing transaction: %s", e)
             return None
 
     async def _monitor_transaction(self, tx_hash: str):
         try:
-            receipt = await self.blockchain.web3.eth.wait_for_transaction_receipt(
-                tx_hash,
-                timeout=300  # 5 minutes timeout
-            )
+            receipt = await self.receipt_watcher.wait_for_receipt(tx_hash)
             
             if receipt['status'] == 1:
-                await self.transaction_repo.update(
+                self._queue_write('update', dict(
                     tx_hash=tx_hash,
                     status='CONFIRMED',
                     block_number=receipt['blockNumber'],
                     gas_used=receipt['gasUsed']
-                )
-                logger.info(f"Transaction confirmed: {tx_hash}")
+                ))
+                logger.info("Transaction confirmed: %s", tx_hash)
             else:
-                await self.transaction_repo.update(
+                self._queue_write('update', dict(
                     tx_hash=tx_hash,
                     status='FAILED',
                     error='Transaction reverted'
-                )
-                logger.warning(f"Transaction failed: {tx_hash}")
-
-            del self.pending_transactions[tx_hash]
+                ))
+                logger.warning("Transaction failed: %s", tx_hash)
 
+        except asyncio.TimeoutError:
+            logger.error("Timed out waiting for receipt of %s", tx_hash)
+            self._queue_write('update', dict(
+                tx_hash=tx_hash,
+                status='FAILED',
+                error='Timed out waiting for receipt'
+            ))
         except Exception as e:
-            logger.error(f"Error monitoring transaction {tx_hash}: {str(e)}")
-            await self.transaction_repo.update(
+            logger.error("Error monitoring transaction %s: %s", tx_hash, e)
+            self._queue_write('update', dict(
                 tx_hash=tx_hash,
                 status='FAILED',
                 error=str(e)
+            ))
+        finally:
+            self.pending_transactions.pop(tx_hash, None)
+
+    def _queue_write(self, op: str, record: Dict) -> None:
+        if self._write_q is None:
+            self._write_q = asyncio.Queue()
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = asyncio.create_task(self._flusher(), name="transaction-writer")
+        self._write_q.put_nowait((op, record))
+
+    async def _flusher(self) -> None:
+        while True:
+            batch = [await self._write_q.get()]
+            # Give a burst a moment to accumulate before hitting the database
+            await asyncio.sleep(self.flush_interval)
+            while len(batch) < self.flush_batch and not self._write_q.empty():
+                batch.append(self._write_q.get_nowait())
+            try:
+                await self._write_batch(batch)
+            finally:
+                for _ in batch:
+                    self._write_q.task_done()
+
+    async def _write_batch(self, batch: List[Tuple[str, Dict]]) -> None:
+        # Inserts go first so an update never races the insert of its own row
+        creates = [record for op, record in batch if op == 'create']
+        updates = [record for op, record in batch if op == 'update']
+        for records, write in ((creates, self.transaction_repo.create),
+                               (updates, self.transaction_repo.update)):
+            results = await asyncio.gather(
+                *(write(**record) for record in records),
+                return_exceptions=True
             )
+            for record, result in zip(records, results):
+                if isinstance(result, Exception):
+                    logger.error("Error writing transaction %s: %s", record['tx_hash'], result)
+
+    async def flush(self) -> None:
+        """Wait until every queued transaction record has been written"""
+        if self._write_q is not None and self._flusher_task is not None and not self._flusher_task.done():
+            await self._write_q.join()
+
+    async def close(self) -> None:
+        """Write out queued records and stop the background writer"""
+        try:
+            await self.flush()
+            if self._flusher_task is not None:
+                self._flusher_task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await self._flusher_task
+                self._flusher_task = None
+            logger.info("Execution manager closed")
+        except Exception as e:
+            logger.error("Error closing execution manager: %s", e)
 
     async def get_transaction_status(self, tx_hash: str) -> Optional[Dict]:
         try:
-            if tx_hash in self.pending_transactions:
-                receipt = await self.blockchain.web3.eth.get_transaction_receipt(tx_hash)
-                return {
-                    'status': 'PENDING' if receipt is None else 'CONFIRMED',
-                    'receipt': receipt
-                }
+            # _monitor_transaction is already waiting on the receipt and records the
+            # outcome, so a status read does not need its own RPC round trip
+            pending = self.pending_transactions.get(tx_hash)
+            if pending is not None:
+                return {'status': pending.status, 'receipt': None}
             
             transaction = await self.transaction_repo.get_by_hash(tx_hash)
             return transaction if transaction else None
 
         except Exception as e:
-            logger.error(f"Error getting transaction status: {str(e)}")
+            logger.error("Error getting transaction status: %s", e)
             return None
 
@@ -1,8 +1,9 @@
 import logging
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 from decimal import Decimal
 from datetime import datetime
 import asyncio
+import random
 from app.core.config import config
 from app.database.repository.trade_repository import TradeRepository
 from app.core.exchange.exchange_manager import ExchangeManager
@@ -24,6 +25,12 @@ class TradeExecutor:
         self.execution_settings = config.get('execution.settings', {})
         self.max_retries = config.get('execution.max_retries', 3)
         self.retry_delay = config.get('execution.retry_delay', 1.0)
+        self.max_backoff = config.get('execution.max_backoff', 30.0)
+        self._trade_listeners: List[Callable[[], None]] = []
+
+    def add_trade_listener(self, listener: Callable[[], None]) -> None:
+        """Register a callback invoked after each executed trade is stored."""
+        self._trade_listeners.append(listener)
 
     async def execute_trade(self, trade_data: Dict) -> Optional[Dict]:
         try:
@@ -35,7 +42,7 @@ class TradeExecutor:
             # Get exchange instance
             exchange = await self.exchange_manager.get_exchange(trade_data['exchange'])
             if not exchange:
-                logger.error(f"Exchange not found: {trade_data['exchange']}")
+                logger.error("Exchange not found: %s", trade_data['exchange'])
                 return None
 
             # Optimize gas (for DEX trades)
@@ -52,51 +59,60 @@ class TradeExecutor:
             stored_trade = await self._store_trade(trade_data, trade_result)
             if stored_trade:
                 self.active_trades[stored_trade['id']] = stored_trade
-                logger.info(f"Trade executed successfully: {stored_trade['id']}")
+                for listener in self._trade_listeners:
+                    listener()
+                logger.info("Trade executed successfully: %s", stored_trade['id'])
                 return stored_trade
 
             return None
 
         except Exception as e:
-            logger.error(f"Error executing trade: {str(e)}")
+            logger.error("Error executing trade: %s", e)
             return None
 
     async def _execute_with_retries(self, exchange: Dict, trade_data: Dict) -> Optional[Dict]:
-        retries = 0
-        while retries < self.max_retries:
+        if trade_data['type'] not in ('MARKET', 'LIMIT'):
+            logger.error("Unsupported trade type: %s", trade_data['type'])
+            return None
+
+        params = self._prepare_trade_params(trade_data)
+        for attempt in range(self.max_retries):
             try:
                 # Execute trade on exchange
-                trade_result = await self._execute_on_exchange(exchange, trade_data)
+                trade_result = await self._execute_on_exchange(exchange, trade_data['type'], params)
                 if trade_result:
                     return trade_result
 
             except Exception as e:
-                logger.error(f"Trade execution attempt {retries + 1} failed: {str(e)}")
-                retries += 1
-                if retries < self.max_retries:
-                    await asyncio.sleep(self.retry_delay)
+                logger.error("Trade execution attempt %s failed: %s", attempt + 1, e)
+                if not self._is_retryable(e):
+                    return None
+
+            if attempt + 1 < self.max_retries:
+                # Exponential backoff with jitter so retries don't arrive in lockstep
+                delay = self.retry_delay * (2 ** attempt) + random.random() * self.retry_delay
+                await asyncio.sleep(min(delay, self.max_backoff))
 
-        logger.error(f"Trade execution failed after {self.max_retries} attempts")
+        logger.error("Trade execution failed after %s attempts", self.max_retries)
         return None
 
-    async def _execute_on_exchange(self, exchange: Dict, trade_data: Dict) -> Optional[Dict]:
-        try:
-            # Prepare trade parameters
-            params = self._prepare_trade_params(trade_data)
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        # Client errors (4xx) won't succeed on retry, except timeouts and throttling
+        status = getattr(error, 'status', None) or getattr(error, 'status_code', None)
+        if isinstance(status, int) and 400 <= status < 500:
+            return status in (408, 429)
+        return True
 
+    async def _execute_on_exchange(self, exchange: Dict, trade_type: str, params: Dict) -> Optional[Dict]:
+        try:
             # Execute trade based on type
-            if trade_data['type'] == 'MARKET':
-                result = await exchange.create_market_order(params)
-            elif trade_data['type'] == 'LIMIT':
-                result = await exchange.create_limit_order(params)
-            else:
-                logger.error(f"Unsupported trade type: {trade_data['type']}")
-                return None
-
-            return result
+            if trade_type == 'MARKET':
+                return await exchange.create_market_order(params)
+            return await exchange.create_limit_order(params)
 
         except Exception as e:
-            logger.error(f"Error executing trade on exchange: {str(e)}")
+            logger.error("Error executing trade on exchange: %s", e)
             raise
 
     def _prepare_trade_params(self, trade_data: Dict) -> Dict:
@@ -119,7 +135,7 @@ class TradeExecutor:
             }
             return await self.trade_repo.create(trade_record)
         except Exception as e:
-            logger.error(f"Error storing trade record: {str(e)}")
+            logger.error("Error storing trade record: %s", e)
             return None
 
     def _validate_trade_data(self, trade_data: Dict) -> bool:
@@ -130,21 +146,21 @@ class TradeExecutor:
         try:
             return self.active_trades.get(trade_id)
         except Exception as e:
-            logger.error(f"Error getting trade: {str(e)}")
+            logger.error("Error getting trade: %s", e)
             return None
 
     async def get_all_trades(self) -> List[Dict]:
         try:
             return list(self.active_trades.values())
         except Exception as e:
-            logger.error(f"Error getting all trades: {str(e)}")
+            logger.error("Error getting all trades: %s", e)
             return []
 
     async def cancel_trade(self, trade_id: str) -> bool:
         try:
             trade = self.active_trades.get(trade_id)
             if not trade:
-                logger.warning(f"Trade not found: {trade_id}")
+                logger.warning("Trade not found: %s", trade_id)
                 return False
 
             exchange = await self.exchange_manager.get_exchange(trade['exchange'])
@@ -156,12 +172,12 @@ class TradeExecutor:
             if success:
                 trade['status'] = 'CANCELLED'
                 await self.trade_repo.update(trade_id, trade)
-                logger.info(f"Cancelled trade: {trade_id}")
+                logger.info("Cancelled trade: %s", trade_id)
                 return True
 
             return False
 
         except Exception as e:
-            logger.error(f"Error cancelling trade: {str(e)}")
+            logger.error("Error cancelling trade: %s", e)
             return False
 
@@ -1,11 +1,30 @@
-from typing import Dict, Any, Optional, Tuple
+from typing import Deque, Dict, Any, Optional, Tuple
 import asyncio
 import logging
+import statistics
+import time
+import types
+from collections import deque
 from decimal import Decimal
 from web3 import Web3
 from web3.types import Wei
 
 class GasOptimizer:
+    _MULTIPLIERS = types.MappingProxyType({
+        'low': 1.1,
+        'medium': 1.3,
+        'high': 1.5,
+        'urgent': 2.0
+    })
+    # eth_feeHistory reward percentiles, and which one each priority tips at
+    _REWARD_PERCENTILES = (10, 50, 90, 99)
+    _PRIORITY_PERCENTILE = types.MappingProxyType({
+        'low': 0,
+        'medium': 1,
+        'high': 2,
+        'urgent': 3
+    })
+
     def __init__(self, config: Dict[str, Any], w3: Web3):
         self.logger = logging.getLogger(__name__)
         self.config = config
@@ -15,14 +34,28 @@ class GasOptimizer:
         self.max_gas_price = Wei(config.get('max_gas_price_gwei', 500) * 10**9)
         self.min_gas_price = Wei(config.get('min_gas_price_gwei', 5) * 10**9)
         self.gas_price_buffer = Decimal(config.get('gas_price_buffer', '1.1'))
+        # Plain numbers for the per-transaction pricing path
+        self._buffer = float(self.gas_price_buffer)
+        self._max_wei = int(self.max_gas_price)
+        self._min_wei = int(self.min_gas_price)
         
         # Historical gas tracking
-        self.gas_price_history = []
         self.max_history_size = config.get('gas_price_history_size', 200)
+        self.gas_price_history: Deque[int] = deque(maxlen=self.max_history_size)
         self.update_interval = config.get('gas_update_interval', 15)
+        self.fee_history_blocks = config.get('fee_history_blocks', 20)
+        # Next-block base fee and per-percentile tips from the last eth_feeHistory;
+        # empty on pre-London chains, where pricing falls back to the multipliers
+        self._fee_history_cache: Dict[str, Any] = {}
+        # Running aggregates over the window: a sum plus monotonic
+        # (sequence, price) deques whose heads are the current min and max
+        self._gas_sum = 0
+        self._gas_seq = 0
+        self._gas_min: Deque[Tuple[int, int]] = deque()
+        self._gas_max: Deque[Tuple[int, int]] = deque()
         
         # Base fee tracking
-        self.base_fee_history = []
+        self.base_fee_history: Deque[int] = deque(maxlen=self.max_history_size)
         self._lock = asyncio.Lock()
 
     async def initialize(self) -> bool:
@@ -31,34 +64,33 @@ class GasOptimizer:
             self.logger.info("Gas Optimizer initialized successfully")
             return True
         except Exception as e:
-            self.logger.error(f"Failed to initialize Gas Optimizer: {str(e)}")
+            self.logger.error("Failed to initialize Gas Optimizer: %s", e)
             return False
 
     async def get_optimal_gas_price(self, priority: str = 'medium') -> Wei:
         try:
-            base_fee = await self._get_base_fee()
-            priority_multiplier = self._get_priority_multiplier(priority)
-            
-            optimal_price = Wei(int(base_fee * priority_multiplier * float(self.gas_price_buffer)))
+            fees = self._fee_history_cache
+            if fees and time.monotonic() - fees['updated'] < 2 * self.update_interval:
+                # Served from the tracker's fee history, no RPC per decision
+                tip = fees['tips'][self._PRIORITY_PERCENTILE.get(priority, 1)]
+                price = int(fees['base_fee'] * self._buffer) + tip
+            else:
+                base_fee = await self._get_base_fee()
+                price = int(base_fee * self._MULTIPLIERS.get(priority, 1.3) * self._buffer)
             
             # Ensure within bounds
-            if optimal_price > self.max_gas_price:
-                return self.max_gas_price
-            if optimal_price < self.min_gas_price:
-                return self.min_gas_price
-                
-            return optimal_price
+            return Wei(min(self._max_wei, max(self._min_wei, price)))
             
         except Exception as e:
-            self.logger.error(f"Error calculating optimal gas price: {str(e)}")
+            self.logger.error("Error calculating optimal gas price: %s", e)
             return self.w3.eth.gas_price
 
     async def estimate_gas_limit(self, transaction: Dict[str, Any]) -> int:
         try:
             estimate = await self.w3.eth.estimate_gas(transaction)
-            return int(estimate * float(self.gas_price_buffer))
+            return int(estimate * self._buffer)
         except Exception as e:
-            self.logger.error(f"Failed to estimate gas limit: {str(e)}")
+            self.logger.error("Failed to estimate gas limit: %s", e)
             return self.config.get('default_gas_limit', 300000)
 
     async def should_replace_transaction(self, 
@@ -77,13 +109,14 @@ class GasOptimizer:
             if new_gas > current_gas:
                 new_gas = current_gas
                 
-            if new_gas > old_gas_price * Decimal('1.125'):
+            # Replacement needs a bump above 12.5%; compare exactly in integers
+            if new_gas * 8 > old_gas_price * 9:
                 return True, new_gas
                 
             return False, None
             
         except Exception as e:
-            self.logger.error(f"Error in transaction replacement check: {str(e)}")
+            self.logger.error("Error in transaction replacement check: %s", e)
             return False, None
 
     async def _start_gas_tracking(self) -> None:
@@ -93,44 +126,81 @@ class GasOptimizer:
     async def _track_gas_prices(self) -> None:
         while True:
             try:
-                current_gas = self.w3.eth.gas_price
-                current_block = await self.w3.eth.get_block('latest')
-                base_fee = current_block.get('baseFeePerGas', current_gas)
+                fees = await self._refresh_fee_history()
+                if fees:
+                    base_fee = fees['base_fee']
+                    current_gas = base_fee + fees['tips'][1]
+                else:
+                    current_gas = self.w3.eth.gas_price
+                    current_block = await self.w3.eth.get_block('latest')
+                    base_fee = current_block.get('baseFeePerGas', current_gas)
                 
                 async with self._lock:
-                    self.gas_price_history.append(current_gas)
+                    self._record_gas_price(current_gas)
                     self.base_fee_history.append(base_fee)
-                    
-                    # Maintain history size
-                    if len(self.gas_price_history) > self.max_history_size:
-                        self.gas_price_history.pop(0)
-                    if len(self.base_fee_history) > self.max_history_size:
-                        self.base_fee_history.pop(0)
                         
                 await asyncio.sleep(self.update_interval)
                 
             except Exception as e:
-                self.logger.error(f"Error tracking gas prices: {str(e)}")
+                self.logger.error("Error tracking gas prices: %s", e)
                 await asyncio.sleep(5)
 
+    async def _refresh_fee_history(self) -> Dict[str, Any]:
+        """Fetch base fee and priority-fee percentiles in one eth_feeHistory call"""
+        try:
+            history = await self.w3.eth.fee_history(
+                self.fee_history_blocks, 'latest', list(self._REWARD_PERCENTILES)
+            )
+            base_fees = history.get('baseFeePerGas')
+            rewards = history.get('reward')
+            if not base_fees or not base_fees[-1] or not rewards:
+                raise ValueError("no EIP-1559 fee data")
+        except Exception as e:
+            self.logger.debug("Fee history unavailable, using legacy pricing: %s", e)
+            self._fee_history_cache = {}
+            return self._fee_history_cache
+
+        # Median across blocks per percentile keeps one outlier block from setting the tip
+        self._fee_history_cache = {
+            'base_fee': base_fees[-1],  # already the base fee of the next block
+            'tips': tuple(int(statistics.median(column)) for column in zip(*rewards)),
+            'updated': time.monotonic()
+        }
+        return self._fee_history_cache
+
+    def _record_gas_price(self, price: int) -> None:
+        history = self.gas_price_history
+        if len(history) == history.maxlen:
+            self._gas_sum -= history[0]
+        history.append(price)
+        self._gas_sum += price
+
+        seq = self._gas_seq
+        self._gas_seq += 1
+        oldest = seq - len(history) + 1
+        while self._gas_min and self._gas_min[-1][1] >= price:
+            self._gas_min.pop()
+        self._gas_min.append((seq, price))
+        while self._gas_min[0][0] < oldest:
+            self._gas_min.popleft()
+        while self._gas_max and self._gas_max[-1][1] <= price:
+            self._gas_max.pop()
+        self._gas_max.append((seq, price))
+        while self._gas_max[0][0] < oldest:
+            self._gas_max.popleft()
+
     async def _get_base_fee(self) -> Wei:
         """Get current base fee with fallback options"""
         try:
             block = await self.w3.eth.get_block('latest')
             return block.get('baseFeePerGas', self.w3.eth.gas_price)
         except Exception as e:
-            self.logger.error(f"Error getting base fee: {str(e)}")
+            self.logger.error("Error getting base fee: %s", e)
             return self.w3.eth.gas_price
 
     def _get_priority_multiplier(self, priority: str) -> float:
         """Get gas price multiplier based on priority"""
-        multipliers = {
-            'low': 1.1,
-            'medium': 1.3,
-            'high': 1.5,
-            'urgent': 2.0
-        }
-        return multipliers.get(priority, 1.3)
+        return self._MULTIPLIERS.get(priority, 1.3)
 
     async def get_gas_stats(self) -> Dict[str, Any]:
         """Get current gas statistics"""
@@ -140,9 +210,9 @@ class GasOptimizer:
                 
             return {
                 'current': self.gas_price_history[-1],
-                'average': sum(self.gas_price_history) / len(self.gas_price_history),
-                'max': max(self.gas_price_history),
-                'min': min(self.gas_price_history),
+                'average': self._gas_sum / len(self.gas_price_history),
+                'max': self._gas_max[0][1],
+                'min': self._gas_min[0][1],
                 'base_fee': self.base_fee_history[-1] if self.base_fee_history else None
             }
 
@@ -1,5 +1,6 @@
 import logging
 import asyncio
+import psutil
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 from app.core.config import config
@@ -18,29 +19,43 @@ class HealthChecker:
         self.health_repo = health_repo
         self.is_running = False
         self.check_interval = config.get('health.check_interval', 60)  # seconds
+        self.component_timeout = config.get('health.component_timeout', 10)  # seconds
         self.components: Dict[str, Dict] = {}
+        # Reports wait here for the WebSocket push; only the newest few are kept
+        self.notify_queue_size = config.get('health.notify_queue_size', 8)
+        self._notify_q: Optional[asyncio.Queue] = None
+        self._notify_task: Optional[asyncio.Task] = None
         self.health_thresholds = {
             'memory_usage_percent': 90.0,
             'cpu_usage_percent': 80.0,
             'disk_usage_percent': 85.0,
             'response_time_ms': 1000
         }
+        self._threshold_pairs = tuple(self.health_thresholds.items())
+        # Prime the CPU counter; later non-blocking reads report the delta since the last call
+        psutil.cpu_percent(interval=None)
 
     async def start(self):
         try:
             self.is_running = True
             asyncio.create_task(self._health_check_loop())
+            # Created here so the queue binds to the running loop
+            self._notify_q = asyncio.Queue(maxsize=self.notify_queue_size)
+            self._notify_task = asyncio.create_task(self._notify_worker())
             logger.info("Health checker started")
         except Exception as e:
-            logger.error(f"Error starting health checker: {str(e)}")
+            logger.error("Error starting health checker: %s", e)
             self.is_running = False
 
     async def stop(self):
         try:
             self.is_running = False
+            if self._notify_task is not None:
+                self._notify_task.cancel()
+                self._notify_task = None
             logger.info("Health checker stopped")
         except Exception as e:
-            logger.error(f"Error stopping health checker: {str(e)}")
+            logger.error("Error stopping health checker: %s", e)
 
     async def register_component(self, component_id: str, check_function) -> bool:
         try:
@@ -49,10 +64,10 @@ class HealthChecker:
                 'last_check': None,
                 'status': 'UNKNOWN'
             }
-            logger.info(f"Registered component: {component_id}")
+            logger.info("Registered component: %s", component_id)
             return True
         except Exception as e:
-            logger.error(f"Error registering component: {str(e)}")
+            logger.error("Error registering component: %s", e)
             return False
 
     async def _health_check_loop(self):
@@ -69,46 +84,53 @@ class HealthChecker:
                 }
 
                 await self._store_health_report(health_report)
-                await self._notify_status(health_report)
+                self._notify_status(health_report)
                 
                 await asyncio.sleep(self.check_interval)
 
             except Exception as e:
-                logger.error(f"Error in health check loop: {str(e)}")
+                logger.error("Error in health check loop: %s", e)
                 await asyncio.sleep(self.check_interval)
 
     async def _check_all_components(self) -> Dict:
+        # Checks are independent, so the batch takes as long as the slowest one
+        items = list(self.components.items())
+        results = await asyncio.gather(
+            *(asyncio.wait_for(component['check_function'](), self.component_timeout)
+              for _, component in items),
+            return_exceptions=True
+        )
+        now = datetime.utcnow()
         component_status = {}
-        for component_id, component in self.components.items():
-            try:
-                status = await component['check_function']()
-                component['last_check'] = datetime.utcnow()
-                component['status'] = status
-                component_status[component_id] = status
-            except Exception as e:
-                logger.error(f"Error checking component {component_id}: {str(e)}")
-                component_status[component_id] = 'ERROR'
+        for (component_id, component), result in zip(items, results):
+            if isinstance(result, BaseException):
+                logger.error("Error checking component %s: %r", component_id, result)
+                result = 'ERROR'
+            component['last_check'] = now
+            component['status'] = result
+            component_status[component_id] = result
         return component_status
 
     async def _get_system_metrics(self) -> Dict:
         try:
-            # Implement system metrics collection
-            # Example: CPU, memory, disk usage, network latency
-            return {
-                'cpu_usage_percent': 0.0,
-                'memory_usage_percent': 0.0,
-                'disk_usage_percent': 0.0,
-                'network_latency_ms': 0.0
-            }
+            return await asyncio.to_thread(self._sample_system_metrics)
         except Exception as e:
-            logger.error(f"Error getting system metrics: {str(e)}")
+            logger.error("Error getting system metrics: %s", e)
             return {}
 
+    @staticmethod
+    def _sample_system_metrics() -> Dict:
+        return {
+            'cpu_usage_percent': psutil.cpu_percent(interval=None),
+            'memory_usage_percent': psutil.virtual_memory().percent,
+            'disk_usage_percent': psutil.disk_usage('/').percent
+        }
+
     def _determine_overall_status(self, component_status: Dict, system_metrics: Dict) -> str:
         try:
             # Check system metrics against thresholds
-            if any(metric > self.health_thresholds.get(metric_name, 100)
-                   for metric_name, metric in system_metrics.items()):
+            if any(system_metrics.get(metric_name, 0) > threshold
+                   for metric_name, threshold in self._threshold_pairs):
                 return 'CRITICAL'
 
             # Check component status
@@ -122,23 +144,33 @@ class HealthChecker:
             return 'UNKNOWN'
 
         except Exception as e:
-            logger.error(f"Error determining overall status: {str(e)}")
+            logger.error("Error determining overall status: %s", e)
             return 'UNKNOWN'
 
     async def _store_health_report(self, health_report: Dict):
         try:
             await self.health_repo.save_health_report(health_report)
         except Exception as e:
-            logger.error(f"Error storing health report: {str(e)}")
+            logger.error("Error storing health report: %s", e)
 
-    async def _notify_status(self, health_report: Dict):
+    def _notify_status(self, health_report: Dict):
+        # Never block the check loop on a slow peer: drop the oldest report instead
         try:
-            await self.websocket_manager.send_message(
-                'health_status',
-                health_report
-            )
-        except Exception as e:
-            logger.error(f"Error notifying status: {str(e)}")
+            self._notify_q.put_nowait(health_report)
+        except asyncio.QueueFull:
+            self._notify_q.get_nowait()
+            self._notify_q.put_nowait(health_report)
+
+    async def _notify_worker(self):
+        while True:
+            health_report = await self._notify_q.get()
+            try:
+                await self.websocket_manager.send_message(
+                    'health_status',
+                    health_report
+                )
+            except Exception as e:
+                logger.error("Error notifying status: %s", e)
 
     async def get_health_status(self) -> Dict:
         try:
@@ -148,7 +180,7 @@ class HealthChecker:
                 'timestamp': datetime.utcnow()
             }
         except Exception as e:
-            logger.error(f"Error getting health status: {str(e)}")
+            logger.error("Error getting health status: %s", e)
             return {'status': 'ERROR', 'error': str(e)}
 
 
@@ -1,7 +1,8 @@
 import logging
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 def setup_logging(log_dir: Path = Path("logs")):
     log_dir.mkdir(exist_ok=True)
@@ -23,10 +24,19 @@ def setup_logging(log_dir: Path = Path("logs")):
     )
     file_handler.setFormatter(file_formatter)
 
+    # Loggers only enqueue records; console and file I/O happen on the listener thread
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(
+        log_queue,
+        console_handler,
+        file_handler,
+        respect_handler_level=True
+    )
+
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.INFO)
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
-
-    return root_logger
+    root_logger.addHandler(QueueHandler(log_queue))
+    listener.start()
 
+    # Call listener.stop() on shutdown to flush queued records
+    return root_logger, listener
@@ -1,16 +1,83 @@
 import logging
+import queue
 import sys
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, Any
 import asyncio
-from logging.handlers import RotatingFileHandler
-import json
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import orjson
+
+def _json_safe(value: Any) -> Any:
+    # orjson only encodes 64-bit integers; wei amounts routinely exceed that
+    if isinstance(value, int) and not -2**63 <= value < 2**64:
+        return str(value)
+    if isinstance(value, dict):
+        return {key: _json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(item) for item in value]
+    return value
+
+def _dumps(obj: Any) -> str:
+    # orjson renders naive datetimes exactly like isoformat(), so get_logs can parse them back
+    try:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        # Only entries carrying an oversized int pay for the rewrite
+        return orjson.dumps(_json_safe(obj), default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+
+class _DrainFlushRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that flushes once per drain of its listener queue.
+
+    Records accumulate in the file object's buffer while more are queued, so a
+    burst costs one write() instead of one per record. Rollover is decided from
+    a running byte count rather than seek/tell, which would flush every record.
+    """
+
+    def __init__(self, filename, log_queue: queue.Queue, **kwargs):
+        self._log_queue = log_queue
+        self._bytes = None
+        self._pending = 0
+        super().__init__(filename, **kwargs)
+
+    def emit(self, record) -> None:
+        # Formatted once; the encoded size feeds shouldRollover and the text is written as-is
+        try:
+            msg = self.format(record) + self.terminator
+            self._pending = len(msg.encode(self.encoding or 'utf-8'))
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            if self._bytes is None:
+                self._bytes = self.stream.tell()
+            self.stream.write(msg)
+            self._bytes += self._pending
+            self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def shouldRollover(self, record) -> int:
+        if self.stream is None:
+            self.stream = self._open()
+        if self._bytes is None:
+            self._bytes = self.stream.tell()
+        return int(self.maxBytes > 0 and self._bytes + self._pending >= self.maxBytes)
+
+    def doRollover(self) -> None:
+        super().doRollover()
+        self._bytes = None
+
+    def flush(self) -> None:
+        # The last record of a drain sees an empty queue and writes the batch out
+        if self._log_queue.empty():
+            super().flush()
 
 class LoggingSystem:
     def __init__(self, log_dir: str = "logs"):
         self.log_dir = Path(log_dir)
         self.loggers = {}
+        self.listeners: Dict[str, QueueListener] = {}
         self._lock = asyncio.Lock()
         self.log_levels = {
             'DEBUG': logging.DEBUG,
@@ -49,8 +116,10 @@ class LoggingSystem:
                 logger.setLevel(level)
 
                 # Create handlers
-                file_handler = RotatingFileHandler(
+                log_queue = queue.Queue(-1)
+                file_handler = _DrainFlushRotatingFileHandler(
                     self.log_dir / filename,
+                    log_queue,
                     maxBytes=10*1024*1024,  # 10MB
                     backupCount=5
                 )
@@ -68,9 +137,16 @@ class LoggingSystem:
                 file_handler.setFormatter(file_formatter)
                 console_handler.setFormatter(console_formatter)
 
-                # Add handlers
-                logger.addHandler(file_handler)
-                logger.addHandler(console_handler)
+                # The logger only enqueues; file and console writes happen on the listener thread
+                listener = QueueListener(
+                    log_queue,
+                    file_handler,
+                    console_handler,
+                    respect_handler_level=True
+                )
+                logger.addHandler(QueueHandler(log_queue))
+                listener.start()
+                self.listeners[name] = listener
 
                 self.loggers[name] = logger
                 return logger
@@ -84,12 +160,12 @@ class LoggingSystem:
             logger = self.loggers.get('strategy')
             if logger:
                 log_entry = {
-                    'timestamp': datetime.utcnow().isoformat(),
+                    'timestamp': datetime.utcnow(),
                     'strategy_id': strategy_id,
                     'event_type': event_type,
                     'data': data
                 }
-                logger.info(json.dumps(log_entry))
+                logger.info(_dumps(log_entry))
         except Exception as e:
             print(f"Failed to log strategy event: {str(e)}")
 
@@ -98,11 +174,11 @@ class LoggingSystem:
             logger = self.loggers.get('performance')
             if logger:
                 log_entry = {
-                    'timestamp': datetime.utcnow().isoformat(),
+                    'timestamp': datetime.utcnow(),
                     'strategy_id': strategy_id,
                     'metrics': metrics
                 }
-                logger.info(json.dumps(log_entry))
+                logger.info(_dumps(log_entry))
         except Exception as e:
             print(f"Failed to log performance metric: {str(e)}")
 
@@ -111,12 +187,12 @@ class LoggingSystem:
             logger = self.loggers.get('error')
             if logger:
                 log_entry = {
-                    'timestamp': datetime.utcnow().isoformat(),
+                    'timestamp': datetime.utcnow(),
                     'source': source,
                     'error_message': error_message,
                     'error_data': error_data or {}
                 }
-                logger.error(json.dumps(log_entry))
+                logger.error(_dumps(log_entry))
         except Exception as e:
             print(f"Failed to log error: {str(e)}")
 
@@ -130,7 +206,7 @@ class LoggingSystem:
                 with open(log_file, 'r') as f:
                     for line in f:
                         try:
-                            log_entry = json.loads(line)
+                            log_entry = orjson.loads(line)
                             timestamp = datetime.fromisoformat(log_entry['timestamp'])
                             
                             if start_time and timestamp < start_time:
@@ -151,6 +227,12 @@ class LoggingSystem:
 
     async def cleanup(self):
         try:
+            # Stopping a listener drains its queue before the handlers are closed
+            for listener in self.listeners.values():
+                listener.stop()
+                for handler in listener.handlers:
+                    handler.close()
+            self.listeners.clear()
             for logger in self.loggers.values():
                 for handler in logger.handlers[:]:
                     handler.close()
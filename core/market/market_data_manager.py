@@ -1,19 +1,37 @@
 import logging
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple
 from decimal import Decimal
 from datetime import datetime
 import asyncio
+import types
+import numpy as np
 from app.core.config import config
 from app.database.repository.market_data_repository import MarketDataRepository
 
 logger = logging.getLogger(__name__)
 
+_EMPTY = types.MappingProxyType({})
+
 class MarketDataManager:
     def __init__(self, market_data_repo: MarketDataRepository):
         self.market_data_repo = market_data_repo
-        self.market_data: Dict[str, Dict] = {}
+        # Read-only snapshot, replaced wholesale each tick; readers keep whichever they grabbed
+        self.market_data: Mapping[str, Mapping] = _EMPTY
         self.update_interval = config.get('market_data.update_interval', 1.0)
         self.is_running = False
+        self._update_listeners: List[Callable[[], None]] = []
+        self.max_concurrent_fetches = config.get('market_data.max_concurrent_fetches', 8)
+        self._fetch_semaphore: Optional[asyncio.Semaphore] = None
+        # Row index per configured symbol for the symbols x exchanges price matrix
+        self._symbols = tuple(config.get('symbols', []))
+        self._symbol_rows = {symbol: row for row, symbol in enumerate(self._symbols)}
+        # Latest aggregated price per symbol row, NaN when unquoted. The extra
+        # trailing slot is always NaN so unknown symbols can index it as -1
+        self._prices = self._unquoted_prices()
+
+    def add_update_listener(self, listener: Callable[[], None]) -> None:
+        """Register a callback invoked after each successful market data update."""
+        self._update_listeners.append(listener)
 
     async def start(self):
         self.is_running = True
@@ -32,10 +50,13 @@ class MarketDataManager:
             on_chain_data = await self._fetch_on_chain_data()
             
             # Process and validate the data
-            processed_data = await self._process_market_data(exchange_data, on_chain_data)
+            processed_data, prices = await self._process_market_data(exchange_data, on_chain_data)
             
-            # Update internal state
-            self.market_data = processed_data
+            # Publish the new snapshot with a single reference swap
+            self.market_data = types.MappingProxyType(processed_data)
+            self._prices = prices
+            for listener in self._update_listeners:
+                listener()
             
             # Persist market data
             await self.market_data_repo.save_market_data(processed_data)
@@ -47,30 +68,39 @@ class MarketDataManager:
             logger.error(f"Error updating market data: {str(e)}")
             return False
 
-    async def get_price(self, symbol: str) -> Optional[Decimal]:
-        try:
-            return self.market_data.get(symbol, {}).get('price')
-        except Exception as e:
-            logger.error(f"Error getting price for {symbol}: {str(e)}")
-            return None
+    def get_price(self, symbol: str) -> Optional[Decimal]:
+        return self.market_data.get(symbol, _EMPTY).get('price')
 
-    async def get_market_depth(self, symbol: str) -> Dict:
-        try:
-            return {
-                'bids': self.market_data.get(symbol, {}).get('bids', []),
-                'asks': self.market_data.get(symbol, {}).get('asks', [])
-            }
-        except Exception as e:
-            logger.error(f"Error getting market depth for {symbol}: {str(e)}")
-            return {'bids': [], 'asks': []}
+    def get_prices(self, symbols: Iterable[str]) -> np.ndarray:
+        """Latest prices for many symbols in one gather; NaN where unquoted or unknown"""
+        rows = self._symbol_rows
+        return self._prices[np.fromiter((rows.get(symbol, -1) for symbol in symbols), dtype=np.intp)]
+
+    def get_market_depth(self, symbol: str) -> Dict:
+        entry = self.market_data.get(symbol, _EMPTY)
+        return {
+            'bids': entry.get('bids', []),
+            'asks': entry.get('asks', [])
+        }
 
     async def _fetch_exchange_data(self) -> Dict:
         try:
-            exchange_data = {}
             exchanges = config.get('exchanges', [])
-            
-            for exchange in exchanges:
-                data = await self._fetch_from_exchange(exchange)
+            # Created on first use so it binds to the running loop
+            if self._fetch_semaphore is None:
+                self._fetch_semaphore = asyncio.Semaphore(self.max_concurrent_fetches)
+
+            # Fan out: a tick waits for the slowest exchange, not the sum of all
+            results = await asyncio.gather(
+                *(self._bounded_fetch(exchange) for exchange in exchanges),
+                return_exceptions=True
+            )
+
+            exchange_data = {}
+            for exchange, data in zip(exchanges, results):
+                if isinstance(data, Exception):
+                    logger.error(f"Error fetching data from {exchange}: {str(data)}")
+                    continue
                 exchange_data[exchange] = data
             
             return exchange_data
@@ -79,6 +109,10 @@ class MarketDataManager:
             logger.error(f"Error fetching exchange data: {str(e)}")
             return {}
 
+    async def _bounded_fetch(self, exchange) -> Dict:
+        async with self._fetch_semaphore:
+            return await self._fetch_from_exchange(exchange)
+
     async def _fetch_on_chain_data(self) -> Dict:
         try:
             # Implement on-chain data fetching logic
@@ -89,30 +123,45 @@ class MarketDataManager:
             logger.error(f"Error fetching on-chain data: {str(e)}")
             return {}
 
-    async def _process_market_data(self, exchange_data: Dict, on_chain_data: Dict) -> Dict:
+    def _unquoted_prices(self) -> np.ndarray:
+        prices = np.full(len(self._symbols) + 1, np.nan)
+        prices.flags.writeable = False
+        return prices
+
+    async def _process_market_data(self, exchange_data: Dict, on_chain_data: Dict) -> Tuple[Dict, np.ndarray]:
         try:
             processed_data = {}
+            if not self._symbols or not exchange_data:
+                return processed_data, self._unquoted_prices()
+
+            # One float64 matrix per tick, NaN where an exchange has no quote
+            prices = np.full((len(self._symbols), len(exchange_data)), np.nan)
+            for col, data in enumerate(exchange_data.values()):
+                for symbol, quote in data.items():
+                    row = self._symbol_rows.get(symbol)
+                    if row is not None and (price := quote.get('price')):
+                        prices[row, col] = float(price)
+
+            quoted = ~np.isnan(prices)
+            counts = quoted.sum(axis=1)
+            means = np.where(quoted, prices, 0.0).sum(axis=1) / np.maximum(counts, 1)
+            published = np.append(np.where(counts > 0, means, np.nan), np.nan)
+            published.flags.writeable = False
+
+            timestamp = datetime.utcnow()
+            sources = list(exchange_data.keys())
+            for row in np.flatnonzero(counts):
+                processed_data[self._symbols[row]] = {
+                    'price': Decimal(str(means[row])),
+                    'timestamp': timestamp,
+                    'sources': sources
+                }
             
-            # Process exchange data
-            for symbol in config.get('symbols', []):
-                prices = []
-                for exchange, data in exchange_data.items():
-                    if price := data.get(symbol, {}).get('price'):
-                        prices.append(price)
-                
-                if prices:
-                    # Calculate aggregated price
-                    processed_data[symbol] = {
-                        'price': sum(prices) / len(prices),
-                        'timestamp': datetime.utcnow(),
-                        'sources': list(exchange_data.keys())
-                    }
-            
-            return processed_data
+            return processed_data, published
 
         except Exception as e:
             logger.error(f"Error processing market data: {str(e)}")
-            return {}
+            return {}, self._unquoted_prices()
 
     def stop(self):
         self.is_running = False
@@ -20,6 +20,9 @@ class MempoolScanner:
         self.scan_interval = config.get('mempool.scan_interval', 1.0)
         self.active_transactions: Dict[str, Dict] = {}
         self.transaction_filters = config.get('mempool.filters', {})
+        self.max_concurrent_saves = config.get('mempool.max_concurrent_saves', 20)
+        # Created on first use so it binds to the running loop
+        self._save_slots: Optional[asyncio.Semaphore] = None
 
     async def start(self):
         try:
@@ -92,23 +95,45 @@ class MempoolScanner:
 
     async def _process_transactions(self, transactions: List[Dict]):
         try:
-            for tx in transactions:
-                # Store transaction
-                await self.mempool_repo.save_transaction(tx)
-                
-                # Analyze transaction
-                analysis = await self._analyze_transaction(tx)
-                
-                if analysis.get('is_interesting'):
+            if not transactions:
+                return
+
+            # Writes and analyses are independent, so issue them together; saves are
+            # capped so a large scan cannot exhaust the database pool
+            if self._save_slots is None:
+                self._save_slots = asyncio.Semaphore(self.max_concurrent_saves)
+            saves = asyncio.gather(
+                *(self._save_transaction(tx) for tx in transactions),
+                return_exceptions=True
+            )
+            analyses = asyncio.gather(
+                *(self._analyze_transaction(tx) for tx in transactions),
+                return_exceptions=True
+            )
+            save_results, analysis_results = await asyncio.gather(saves, analyses)
+
+            for tx, result in zip(transactions, save_results):
+                if isinstance(result, Exception):
+                    logger.error(f"Error saving transaction {tx.get('hash')}: {str(result)}")
+
+            now = datetime.utcnow()
+            for tx, analysis in zip(transactions, analysis_results):
+                if isinstance(analysis, Exception):
+                    logger.error(f"Error analyzing transaction {tx.get('hash')}: {str(analysis)}")
+                elif analysis.get('is_interesting'):
                     self.active_transactions[tx['hash']] = {
                         'transaction': tx,
                         'analysis': analysis,
-                        'timestamp': datetime.utcnow()
+                        'timestamp': now
                     }
 
         except Exception as e:
             logger.error(f"Error processing transactions: {str(e)}")
 
+    async def _save_transaction(self, transaction: Dict) -> None:
+        async with self._save_slots:
+            await self.mempool_repo.save_transaction(transaction)
+
     async def _analyze_transaction(self, transaction: Dict) -> Dict:
         try:
             # Implement transaction analysis logic
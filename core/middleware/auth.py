@@ -1,9 +1,14 @@
 from fastapi import Request, HTTPException
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
+from app.api.auth.token_cache import ValidTokenCache, looks_like_jwt
 from app.core.config import get_settings
 
 settings = get_settings()
+_ALGORITHMS = (settings.JWT_ALGORITHM,)
+
+# Shared by every JWTBearer instance; entries never outlive the token's exp
+_token_cache = ValidTokenCache(ttl=60.0, maxsize=4096)
 
 class JWTBearer(HTTPBearer):
     def __init__(self, auto_error: bool = True):
@@ -21,13 +26,20 @@ class JWTBearer(HTTPBearer):
             raise HTTPException(status_code=403, detail="Invalid authorization code.")
 
     def verify_jwt(self, jwtoken: str) -> bool:
+        if not looks_like_jwt(jwtoken):
+            return False
+        cached = _token_cache.get(jwtoken)
+        if cached is not None:
+            return cached
         try:
             payload = jwt.decode(
                 jwtoken, 
                 settings.SECRET_KEY, 
-                algorithms=[settings.JWT_ALGORITHM]
+                algorithms=_ALGORITHMS
             )
-            return True if payload else False
+            decision = True if payload else False
         except JWTError:
-            return False
+            decision = False
+        _token_cache.set(jwtoken, decision)
+        return decision
 
@@ -1,37 +1,61 @@
 from fastapi import Request, HTTPException
+import array
 import time
-from collections import defaultdict
 from typing import Dict
 import asyncio
 
+_WINDOW = 60  # seconds
+
+class _RequestWindow:
+    # Per-IP ring of one-second request counters plus their running total
+    __slots__ = ('buckets', 'last_sec', 'total')
+
+    def __init__(self, sec: int):
+        self.buckets = array.array('I', bytes(4 * _WINDOW))
+        self.last_sec = sec
+        self.total = 0
+
+    def advance(self, sec: int) -> None:
+        if sec - self.last_sec >= _WINDOW:
+            self.buckets = array.array('I', bytes(4 * _WINDOW))
+            self.total = 0
+        else:
+            # Zero the seconds that slid out of the window since the last request
+            for expired in range(self.last_sec + 1, sec + 1):
+                slot = expired % _WINDOW
+                self.total -= self.buckets[slot]
+                self.buckets[slot] = 0
+        self.last_sec = sec
+
 class RateLimiter:
     def __init__(self, requests_per_minute: int = 60):
         self.requests_per_minute = requests_per_minute
-        self.requests: Dict[str, list] = defaultdict(list)
+        self.requests: Dict[str, _RequestWindow] = {}
         self._cleanup_task = asyncio.create_task(self._cleanup_old_requests())
 
     async def _cleanup_old_requests(self):
         while True:
-            current_time = time.time()
-            for ip in list(self.requests.keys()):
-                self.requests[ip] = [req_time for req_time in self.requests[ip]
-                                   if current_time - req_time < 60]
-                if not self.requests[ip]:
-                    del self.requests[ip]
-            await asyncio.sleep(60)
+            # Requests advance their own window; this only drops IPs that have gone quiet
+            cutoff = int(time.monotonic()) - _WINDOW
+            for ip in [ip for ip, window in self.requests.items() if window.last_sec <= cutoff]:
+                del self.requests[ip]
+            await asyncio.sleep(_WINDOW)
 
     async def __call__(self, request: Request):
         ip = request.client.host
-        current_time = time.time()
+        sec = int(time.monotonic())
         
-        self.requests[ip] = [req_time for req_time in self.requests[ip]
-                           if current_time - req_time < 60]
+        window = self.requests.get(ip)
+        if window is None:
+            window = self.requests[ip] = _RequestWindow(sec)
+        elif window.last_sec != sec:
+            window.advance(sec)
         
-        if len(self.requests[ip]) >= self.requests_per_minute:
+        if window.total >= self.requests_per_minute:
             raise HTTPException(
                 status_code=429,
                 detail="Too many requests"
             )
         
-        self.requests[ip].append(current_time)
-
+        window.buckets[sec % _WINDOW] += 1
+        window.total += 1
@@ -0,0 +1,54 @@
+from typing import Dict, Optional
+import logging
+import aiohttp
+from web3 import AsyncWeb3, AsyncHTTPProvider
+
+logger = logging.getLogger(__name__)
+
+# Shared keep-alive pool for the Web3 provider and external price APIs.
+# Created lazily because aiohttp sessions must be bound to a running loop.
+_connector: Optional[aiohttp.TCPConnector] = None
+_session: Optional[aiohttp.ClientSession] = None
+# One AsyncWeb3 per RPC endpoint, so every component shares its pooled connections
+_web3_clients: Dict[str, AsyncWeb3] = {}
+
+def get_http_session() -> aiohttp.ClientSession:
+    global _connector, _session
+    if _session is None or _session.closed:
+        _connector = aiohttp.TCPConnector(
+            limit=200,
+            limit_per_host=50,
+            keepalive_timeout=75,
+            ttl_dns_cache=300
+        )
+        _session = aiohttp.ClientSession(connector=_connector)
+    return _session
+
+async def get_async_web3(provider_uri: str, timeout: float = 30) -> AsyncWeb3:
+    """Return the AsyncWeb3 for `provider_uri`, built once on the shared HTTP session."""
+    w3 = _web3_clients.get(provider_uri)
+    if w3 is not None:
+        return w3
+    provider = AsyncHTTPProvider(provider_uri, request_kwargs={'timeout': aiohttp.ClientTimeout(total=timeout)})
+    await provider.cache_async_session(get_http_session())
+    # Another caller may have finished building one while we awaited
+    return _web3_clients.setdefault(provider_uri, AsyncWeb3(provider))
+
+async def close_http_session() -> None:
+    global _connector, _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+        logger.info("Shared HTTP session closed")
+    _web3_clients.clear()
+    _session = None
+    _connector = None
+
+def get_pool_stats() -> Dict[str, int]:
+    if _connector is None or _connector.closed:
+        return {'limit': 0, 'limit_per_host': 0, 'acquired': 0, 'idle': 0}
+    return {
+        'limit': _connector.limit,
+        'limit_per_host': _connector.limit_per_host,
+        'acquired': len(_connector._acquired),
+        'idle': sum(len(conns) for conns in _connector._conns.values())
+    }
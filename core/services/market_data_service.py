@@ -1,10 +1,10 @@
 from typing import Dict, Optional, List
 from decimal import Decimal
 import logging
-import aiohttp
 import asyncio
 from datetime import datetime
 from app.core.services.cache_service import CacheService
+from app.core.services.http_pool import get_http_session
 
 logger = logging.getLogger(__name__)
 
@@ -22,11 +22,11 @@ class MarketDataService:
 
     async def initialize(self):
         if not self.session:
-            self.session = aiohttp.ClientSession()
+            self.session = get_http_session()
 
     async def cleanup(self):
-        if self.session:
-            await self.session.close()
+        # The shared session is closed by the application on shutdown
+        self.session = None
 
     async def get_token_price(
         self,
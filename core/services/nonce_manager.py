@@ -0,0 +1,32 @@
+from typing import Dict
+import asyncio
+import logging
+from web3 import Web3
+
+logger = logging.getLogger(__name__)
+
+class NonceManager:
+    """Hands out account nonces locally instead of querying the node per transaction.
+
+    The nonce for an address is fetched from the chain once and then
+    incremented in-process. Call `reset` after a failed transaction so the
+    next nonce is resynchronised from the chain. Nonces are tracked per
+    process, so an account should only be signed for from one process.
+    """
+
+    def __init__(self, web3: Web3):
+        self.web3 = web3
+        self._nonces: Dict[str, int] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    async def next(self, address: str) -> int:
+        async with self._locks.setdefault(address, asyncio.Lock()):
+            nonce = self._nonces.get(address)
+            if nonce is None:
+                nonce = await self.web3.eth.get_transaction_count(address, 'pending')
+            self._nonces[address] = nonce + 1
+            return nonce
+
+    def reset(self, address: str) -> None:
+        if self._nonces.pop(address, None) is not None:
+            logger.debug(f"Nonce for {address} will be resynced from chain")
@@ -0,0 +1,90 @@
+from typing import Dict, Set
+import asyncio
+import logging
+from hexbytes import HexBytes
+from web3 import Web3
+from web3.exceptions import TransactionNotFound
+
+logger = logging.getLogger(__name__)
+
+class ReceiptWatcher:
+    """Resolves transaction receipts from one shared new-block loop.
+
+    Instead of every sender polling eth_getTransactionReceipt, a single
+    background task follows the chain head and fetches a receipt only once
+    its transaction shows up in a block. The task runs while there are
+    pending transactions and stops when there are none left.
+    """
+
+    def __init__(self, web3: Web3, poll_interval: float = 1.0, timeout: float = 120.0):
+        self.web3 = web3
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.pending: Dict[bytes, asyncio.Future] = {}
+        self._unchecked: Set[bytes] = set()
+        self._last_block = None
+        self._task = None
+
+    def register(self, tx_hash) -> asyncio.Future:
+        key = bytes(HexBytes(tx_hash))
+        future = self.pending.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self.pending[key] = future
+            # The transaction may already be in a block we have processed
+            self._unchecked.add(key)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return future
+
+    async def wait_for_receipt(self, tx_hash):
+        key = bytes(HexBytes(tx_hash))
+        try:
+            return await asyncio.wait_for(asyncio.shield(self.register(tx_hash)), self.timeout)
+        finally:
+            future = self.pending.pop(key, None)
+            if future is not None and not future.done():
+                future.cancel()
+            self._unchecked.discard(key)
+
+    async def _run(self) -> None:
+        try:
+            if self._last_block is None:
+                self._last_block = await self.web3.eth.block_number
+            while self.pending:
+                await self._check_unchecked()
+                latest = await self.web3.eth.block_number
+                for block_number in range(self._last_block + 1, latest + 1):
+                    await self._dispatch_block(block_number)
+                self._last_block = latest
+                if self.pending:
+                    await asyncio.sleep(self.poll_interval)
+        except Exception as e:
+            logger.error(f"Receipt watcher failed: {str(e)}")
+            for future in self.pending.values():
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # Resume from the current head next time, not from stale history
+            self._last_block = None
+
+    async def _check_unchecked(self) -> None:
+        keys, self._unchecked = self._unchecked, set()
+        await asyncio.gather(*(self._resolve(key) for key in keys))
+
+    async def _dispatch_block(self, block_number: int) -> None:
+        block = await self.web3.eth.get_block(block_number)
+        mined = [bytes(tx) for tx in block['transactions'] if bytes(tx) in self.pending]
+        if mined:
+            await asyncio.gather(*(self._resolve(key) for key in mined))
+
+    async def _resolve(self, key: bytes) -> None:
+        future = self.pending.get(key)
+        if future is None or future.done():
+            return
+        try:
+            receipt = await self.web3.eth.get_transaction_receipt(key)
+        except TransactionNotFound:
+            return
+        if not future.done():
+            future.set_result(receipt)
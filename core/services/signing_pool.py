@@ -0,0 +1,37 @@
+from typing import Any, Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+import asyncio
+import logging
+import os
+from eth_account import Account
+
+logger = logging.getLogger(__name__)
+
+# Set in each worker process by the pool initializer so the key is sent once
+# per worker at startup rather than with every signing request
+_worker_account = None
+
+def _init_worker(private_key: bytes) -> None:
+    global _worker_account
+    _worker_account = Account.from_key(private_key)
+
+def _sign_worker(transaction: Dict[str, Any]) -> bytes:
+    return bytes(_worker_account.sign_transaction(transaction).rawTransaction)
+
+class SigningPool:
+    """Signs transactions in worker processes to keep signing off the event loop."""
+
+    def __init__(self, private_key: bytes, max_workers: Optional[int] = None):
+        self._executor = ProcessPoolExecutor(
+            max_workers=max_workers or os.cpu_count(),
+            initializer=_init_worker,
+            initargs=(private_key,)
+        )
+
+    async def sign(self, transaction: Dict[str, Any]) -> bytes:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, _sign_worker, transaction)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False)
+        logger.info("Signing pool shut down")
@@ -1,11 +1,28 @@
 from web3 import Web3
 from eth_account import Account
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from app.core.config import get_settings
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
+async def batch_contract_calls(web3: Web3, functions: List[Any]) -> List[Any]:
+    """Execute bound contract functions as a single JSON-RPC batch.
+
+    Falls back to concurrent individual calls on web3 versions or
+    providers without batch support.
+    """
+    if hasattr(web3, 'batch_requests'):
+        try:
+            async with web3.batch_requests() as batch:
+                for fn in functions:
+                    batch.add(fn)
+                return await batch.async_execute()
+        except NotImplementedError:
+            logger.debug("Provider does not support batch requests, falling back")
+    return await asyncio.gather(*(fn.call() for fn in functions))
+
 class Web3Service:
     def __init__(self):
         self.settings = get_settings()
@@ -24,12 +24,18 @@ class StrategyExecutor:
         self.active_executions = {}
         self.execution_history = []
 
-    async def execute_strategy(self, strategy_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
-        execution_id = f"{strategy_name}_{datetime.utcnow().timestamp()}"
+    async def execute_strategy(
+        self,
+        strategy_name: str,
+        params: Dict[str, Any],
+        execution_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        execution_id = execution_id or f"{strategy_name}_{datetime.utcnow().timestamp()}"
         
         try:
             async with self._lock:
                 self.active_executions[execution_id] = {
+                    'execution_id': execution_id,
                     'status': 'initializing',
                     'start_time': datetime.utcnow(),
                     'strategy_name': strategy_name,
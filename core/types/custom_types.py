@@ -1,5 +1,6 @@
 from typing import TypeVar, Dict, Union
 from decimal import Decimal
+from enum import Enum
 from pydantic import BaseModel
 
 Address = str
@@ -11,5 +12,13 @@ class TokenAmount(BaseModel):
     amount: Decimal
     decimals: int = 18
 
+class OrderSide(str, Enum):
+    BUY = "BUY"
+    SELL = "SELL"
+
+class OrderType(str, Enum):
+    MARKET = "MARKET"
+    LIMIT = "LIMIT"
+
 JsonDict = Dict[str, Union[str, int, float, bool, None]]
 
@@ -1,7 +1,8 @@
 import logging
 import asyncio
 import json
-from typing import Dict, List, Optional, Callable
+import orjson
+from typing import Dict, List, Optional, Callable, Union
 import websockets
 from websockets.exceptions import ConnectionClosed
 from app.core.config import config
@@ -147,7 +148,7 @@ class WebSocketManager:
             logger.error(f"Error unsubscribing from channel: {str(e)}")
             return False
 
-    async def send_message(self, channel: str, message: Dict) -> bool:
+    async def send_message(self, channel: str, message: Union[Dict, bytes]) -> bool:
         try:
             if channel not in self.connections:
                 logger.warning(f"Channel {channel} not connected")
@@ -158,7 +159,12 @@ class WebSocketManager:
                 logger.warning(f"Channel {channel} not connected")
                 return False
 
-            await connection['websocket'].send(json.dumps(message))
+            # Already-encoded payloads (e.g. EventListener.event_payload) go out as-is.
+            # bytes go out as a binary frame rather than being decoded back to str;
+            # json.loads, as used by _handle_messages, parses either frame type
+            if not isinstance(message, (bytes, bytearray)):
+                message = orjson.dumps(message, default=str)
+            await connection['websocket'].send(message)
             return True
 
         except Exception as e:
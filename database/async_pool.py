@@ -0,0 +1,40 @@
+import logging
+import asyncpg
+from fastapi import FastAPI, Request
+from redis import asyncio as aioredis
+from app.constants.settings import settings
+
+logger = logging.getLogger(__name__)
+
+async def init_pools(app: FastAPI) -> None:
+    """Create the shared Postgres and Redis pools once per process."""
+    app.state.pg = await asyncpg.create_pool(
+        settings.DATABASE_URL,
+        min_size=10,
+        max_size=50,
+        max_queries=50000,
+        max_inactive_connection_lifetime=300,
+        command_timeout=60
+    )
+    app.state.redis = aioredis.from_url(
+        settings.REDIS_URL,
+        max_connections=50,
+        decode_responses=True
+    )
+    logger.info("Database and Redis pools initialized")
+
+async def close_pools(app: FastAPI) -> None:
+    pg = getattr(app.state, 'pg', None)
+    if pg is not None:
+        await pg.close()
+    redis = getattr(app.state, 'redis', None)
+    if redis is not None:
+        await redis.close()
+        await redis.connection_pool.disconnect()
+    logger.info("Database and Redis pools closed")
+
+def get_pg(request: Request) -> asyncpg.Pool:
+    return request.app.state.pg
+
+def get_redis(request: Request) -> aioredis.Redis:
+    return request.app.state.redis
@@ -0,0 +1,36 @@
+from app.core.bundle_builder import BundleBuilder, Tx
+
+ALICE = "0x" + "a" * 40
+BOB = "0x" + "b" * 40
+CAROL = "0x" + "c" * 40
+
+
+def _tx(sender: str, to: str, nonce: int) -> Tx:
+    return Tx(sender, to, nonce, 1, 21000, 0, "0x", {})
+
+
+def _resolve(transactions):
+    builder = object.__new__(BundleBuilder)
+    return builder._resolve_dependencies(transactions)
+
+
+def test_dependent_transaction_is_ordered_first():
+    # The BOB tx calls ALICE, so it is placed ahead of ALICE's tx
+    alice = _tx(ALICE, CAROL, 0)
+    bob = _tx(BOB, ALICE, 0)
+    assert _resolve([alice, bob]) == [bob, alice]
+
+
+def test_same_sender_nonces_are_linked():
+    first = _tx(ALICE, CAROL, 1)
+    second = _tx(ALICE, CAROL, 2)
+    unrelated = _tx(BOB, CAROL, 0)
+    ordered = _resolve([first, unrelated, second])
+    assert len(ordered) == 3 and unrelated in ordered
+    assert ordered.index(second) < ordered.index(first)
+
+
+def test_cycle_keeps_input_order():
+    alice = _tx(ALICE, BOB, 0)
+    bob = _tx(BOB, ALICE, 0)
+    assert _resolve([alice, bob]) == [alice, bob]
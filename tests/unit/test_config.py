@@ -0,0 +1,44 @@
+from app.core.config import Config
+
+
+def _bare_config(tree):
+    # Skip the singleton's file loading; only the lookup structures are exercised
+    cfg = object.__new__(Config)
+    cfg._config = tree
+    cfg._flat = cfg._flatten(tree)
+    return cfg
+
+
+def test_flatten_keeps_leaves_and_sections():
+    cfg = _bare_config({"web3": {"provider_url": "http://node", "retry": {"max": 3}}, "debug": True})
+    assert cfg.get("web3.provider_url") == "http://node"
+    assert cfg.get("web3.retry.max") == 3
+    assert cfg.get("web3.retry") == {"max": 3}
+    assert cfg.get("debug") is True
+
+
+def test_get_returns_default_for_missing_key():
+    cfg = _bare_config({"web3": {"provider_url": "http://node"}})
+    assert cfg.get("web3.missing") is None
+    assert cfg.get("web3.missing", 5) == 5
+    assert cfg.get("web3.provider_url.deeper", "x") == "x"
+
+
+def test_convert_value_types():
+    assert Config._convert_value("true") is True
+    assert Config._convert_value("False") is False
+    assert Config._convert_value("42") == 42
+    assert Config._convert_value("-7") == -7
+    assert Config._convert_value("1.5") == 1.5
+    assert Config._convert_value("0x1f") == "0x1f"
+
+
+def test_convert_value_keeps_int_semantics():
+    assert Config._convert_value("1_000") == 1000
+    assert isinstance(Config._convert_value("1_000"), int)
+    assert Config._convert_value(" 5 ") == 5
+
+
+def test_convert_value_does_not_raise_on_malformed_signs():
+    assert Config._convert_value("--5") == "--5"
+    assert Config._convert_value("+-1") == "+-1"
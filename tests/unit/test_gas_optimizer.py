@@ -0,0 +1,41 @@
+import random
+
+import pytest
+
+from app.core.gas_optimizer import GasOptimizer
+
+
+def _optimizer(window: int) -> GasOptimizer:
+    return GasOptimizer({'gas_price_history_size': window}, w3=None)
+
+
+@pytest.mark.asyncio
+async def test_window_stats_match_recorded_prices():
+    optimizer = _optimizer(5)
+    rng = random.Random(7)
+    prices = []
+    for _ in range(50):
+        price = rng.randrange(1, 100) * 10**9
+        prices.append(price)
+        optimizer._record_gas_price(price)
+
+        window = prices[-5:]
+        stats = await optimizer.get_gas_stats()
+        assert stats['current'] == price
+        assert stats['min'] == min(window)
+        assert stats['max'] == max(window)
+        assert stats['average'] == sum(window) / len(window)
+
+
+@pytest.mark.asyncio
+async def test_extreme_leaves_window():
+    optimizer = _optimizer(3)
+    for price in (100, 1, 50, 60, 70):
+        optimizer._record_gas_price(price)
+    stats = await optimizer.get_gas_stats()
+    assert (stats['min'], stats['max']) == (50, 70)
+
+
+@pytest.mark.asyncio
+async def test_empty_history_has_no_stats():
+    assert await _optimizer(3).get_gas_stats() == {}
@@ -0,0 +1,47 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.services.nonce_manager import NonceManager
+
+ADDRESS = "0x1234567890123456789012345678901234567890"
+
+
+class _Eth:
+    def __init__(self, count: int):
+        self.count = count
+        self.calls = 0
+
+    async def get_transaction_count(self, address, block_identifier):
+        self.calls += 1
+        await asyncio.sleep(0)
+        return self.count
+
+
+@pytest.mark.asyncio
+async def test_nonces_increment_locally():
+    eth = _Eth(7)
+    manager = NonceManager(SimpleNamespace(eth=eth))
+    assert [await manager.next(ADDRESS) for _ in range(3)] == [7, 8, 9]
+    assert eth.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callers_get_distinct_nonces():
+    eth = _Eth(0)
+    manager = NonceManager(SimpleNamespace(eth=eth))
+    nonces = await asyncio.gather(*(manager.next(ADDRESS) for _ in range(5)))
+    assert sorted(nonces) == [0, 1, 2, 3, 4]
+    assert eth.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_reset_resyncs_from_chain():
+    eth = _Eth(3)
+    manager = NonceManager(SimpleNamespace(eth=eth))
+    await manager.next(ADDRESS)
+    eth.count = 10
+    manager.reset(ADDRESS)
+    assert await manager.next(ADDRESS) == 10
+    assert eth.calls == 2
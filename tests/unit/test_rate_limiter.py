@@ -0,0 +1,51 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.middleware import rate_limiter
+from app.core.middleware.rate_limiter import RateLimiter, _RequestWindow, _WINDOW
+
+
+def _request(host: str = "10.0.0.1"):
+    return SimpleNamespace(client=SimpleNamespace(host=host))
+
+
+def test_window_expires_buckets_that_slid_out():
+    # Requests at seconds 0 and 5; by second 62 only the latter is in the window
+    window = _RequestWindow(10)
+    window.buckets[0] = 3
+    window.buckets[5] = 2
+    window.total = 5
+    window.advance(_WINDOW + 2)
+    assert window.total == 2
+    assert window.buckets[0] == 0
+    assert window.buckets[5] == 2
+
+
+def test_window_resets_after_long_idle():
+    window = _RequestWindow(0)
+    window.buckets[1] = 4
+    window.total = 4
+    window.advance(3 * _WINDOW)
+    assert window.total == 0
+    assert not any(window.buckets)
+
+
+@pytest.mark.asyncio
+async def test_limit_applies_per_ip_and_recovers(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(rate_limiter.time, "monotonic", lambda: now[0])
+    limiter = RateLimiter(requests_per_minute=2)
+    try:
+        await limiter(_request())
+        await limiter(_request())
+        with pytest.raises(HTTPException) as exc:
+            await limiter(_request())
+        assert exc.value.status_code == 429
+        await limiter(_request("10.0.0.2"))
+
+        now[0] += _WINDOW
+        await limiter(_request())
+    finally:
+        limiter._cleanup_task.cancel()
@@ -0,0 +1,63 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from web3.exceptions import TransactionNotFound
+
+from app.core.services.receipt_watcher import ReceiptWatcher
+
+TX_HASH = b"\x01" * 32
+
+
+class _Eth:
+    def __init__(self):
+        self.head = 100
+        self.blocks = {}
+        self.receipts = {}
+        self.receipt_calls = 0
+
+    @property
+    async def block_number(self):
+        return self.head
+
+    async def get_block(self, number):
+        return {'transactions': self.blocks.get(number, [])}
+
+    async def get_transaction_receipt(self, tx_hash):
+        self.receipt_calls += 1
+        if tx_hash not in self.receipts:
+            raise TransactionNotFound(tx_hash)
+        return self.receipts[tx_hash]
+
+
+@pytest.mark.asyncio
+async def test_receipt_resolves_when_transaction_is_mined():
+    eth = _Eth()
+    watcher = ReceiptWatcher(SimpleNamespace(eth=eth), poll_interval=0.01, timeout=1)
+    waiter = asyncio.create_task(watcher.wait_for_receipt(TX_HASH))
+    await asyncio.sleep(0.02)
+    assert not waiter.done()
+
+    eth.head = 101
+    eth.blocks[101] = [TX_HASH]
+    eth.receipts[TX_HASH] = {'status': 1}
+    assert await waiter == {'status': 1}
+    # Only the initial check and the mined block fetched the receipt
+    assert eth.receipt_calls == 2
+    assert not watcher.pending
+
+
+@pytest.mark.asyncio
+async def test_already_mined_transaction_resolves_immediately():
+    eth = _Eth()
+    eth.receipts[TX_HASH] = {'status': 1}
+    watcher = ReceiptWatcher(SimpleNamespace(eth=eth), poll_interval=0.01, timeout=1)
+    assert await watcher.wait_for_receipt("0x" + TX_HASH.hex()) == {'status': 1}
+
+
+@pytest.mark.asyncio
+async def test_wait_times_out_and_forgets_the_transaction():
+    watcher = ReceiptWatcher(SimpleNamespace(eth=_Eth()), poll_interval=0.01, timeout=0.05)
+    with pytest.raises(asyncio.TimeoutError):
+        await watcher.wait_for_receipt(TX_HASH)
+    assert not watcher.pending
@@ -0,0 +1,58 @@
+import base64
+import json
+import time
+
+from app.api.auth.token_cache import ValidTokenCache, looks_like_jwt
+
+
+def _jwt(exp: float) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps({"exp": exp}).encode()).rstrip(b"=").decode()
+    return f"eyJhbGciOiJIUzI1NiJ9.{payload}.signature"
+
+
+def test_cached_decision_is_returned():
+    cache = ValidTokenCache()
+    token = _jwt(time.time() + 600)
+    assert cache.get(token) is None
+    cache.set(token, True)
+    assert cache.get(token) is True
+
+
+def test_raw_token_is_not_stored():
+    # Entries are keyed by digest: an equal token built separately hits,
+    # a token differing in one character does not
+    cache = ValidTokenCache()
+    token = _jwt(time.time() + 600)
+    cache.set(token, True)
+    assert cache.get("".join(list(token))) is True
+    assert cache.get(token[:-1] + "X") is None
+
+
+def test_expired_jwt_is_not_cached():
+    cache = ValidTokenCache()
+    token = _jwt(time.time() - 1)
+    cache.set(token, True)
+    assert cache.get(token) is None
+
+
+def test_maxsize_is_respected():
+    cache = ValidTokenCache(maxsize=2)
+    tokens = [f"{_jwt(time.time() + 600)}{i}" for i in range(5)]
+    for token in tokens:
+        cache.set(token, True)
+    # The oldest insertions were evicted; only the newest two remain
+    assert [cache.get(token) for token in tokens] == [None, None, None, True, True]
+
+
+def test_rejections_use_negative_ttl():
+    cache = ValidTokenCache(negative_ttl=0)
+    token = _jwt(time.time() + 600)
+    cache.set(token, False)
+    assert cache.get(token) is None
+
+
+def test_looks_like_jwt():
+    assert looks_like_jwt(_jwt(time.time() + 600))
+    assert not looks_like_jwt("not-a-token")
+    assert not looks_like_jwt("a.b.c")
+    assert not looks_like_jwt("abc.def.ghi jkl.mno")